@@ -0,0 +1,85 @@
+"""
+Compares DRF's stdlib JSONRenderer/JSONParser with the orjson-backed
+FastJSONRenderer/FastJSONParser on payloads shaped like this API's:
+a page of posts, and a bulk create request body.
+
+    python benchmarks/json_rendering.py --posts 100
+"""
+import argparse
+import io
+import os
+import sys
+import timeit
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog_drf.settings")
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from blog_drf.parsers import FastJSONParser  # noqa: E402
+from blog_drf.renderers import FastJSONRenderer, orjson  # noqa: E402
+
+
+def get_page(size: int) -> dict:
+    return {
+        "next": "http://testserver/posts/?cursor=cD0xMDA%3D",
+        "previous": None,
+        "results": [
+            {
+                "id": i,
+                "title": f"Post title number {i}",
+                "content": "Lorem ipsum dolor sit amet, consectetur adipiscing. " * 8,
+                "created_at": "2023-09-20T10:15:30.123456Z",
+                "updated_at": "2023-09-21T08:00:00.654321Z",
+                "categories": ["python", "django", "drf"],
+                "owner": i % 50,
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def measure(name: str, func, number: int, repeat: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{name:>24}: {best * 1_000_000:8.1f} µs")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if orjson is None:
+        sys.exit("orjson is not installed: pip install 'blog-drf[fast-json]'.")
+
+    page = get_page(args.posts)
+    body = JSONRenderer().render(page["results"])
+    if FastJSONRenderer().render(page) != JSONRenderer().render(page):
+        sys.exit("FastJSONRenderer output differs from JSONRenderer.")
+
+    for action, stdlib, fast in (
+        (
+            "render",
+            lambda: JSONRenderer().render(page),
+            lambda: FastJSONRenderer().render(page),
+        ),
+        (
+            "parse",
+            lambda: JSONParser().parse(io.BytesIO(body)),
+            lambda: FastJSONParser().parse(io.BytesIO(body)),
+        ),
+    ):
+        slow = measure(f"{action} stdlib", stdlib, args.number, args.repeat)
+        quick = measure(f"{action} orjson", fast, args.number, args.repeat)
+        print(f"{action + ' speedup':>24}: {slow / quick:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares rendering one `/posts/` page through `PostSerializer` with the
+`ValuesSerializer` fast path: query, serialization and JSON rendering.
+
+Runs against the database from the project settings, which must hold at
+least `--page-size` posts:
+
+    python benchmarks/list_serialization.py --page-size 100
+"""
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog_drf.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from posts.models import Post  # noqa: E402
+from posts.serializers import PostSerializer, ValuesSerializer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    # Query logging would be counted against both paths.
+    settings.DEBUG = False
+
+    queryset = Post.objects.prefetch_related("categories").order_by("id")
+    values_serializer = ValuesSerializer(PostSerializer)
+    renderer = JSONRenderer()
+
+    def serializer_page():
+        page = list(queryset[: args.page_size])
+        return renderer.render(PostSerializer(page, many=True).data)
+
+    def values_page():
+        page = list(values_serializer.get_queryset(queryset)[: args.page_size])
+        return renderer.render(values_serializer.to_representation(page))
+
+    if serializer_page() != values_page():
+        sys.exit("The fast path output differs from PostSerializer.")
+
+    results = {}
+    for name, page in (("serializer", serializer_page), ("values", values_page)):
+        best = min(timeit.repeat(page, number=args.number, repeat=args.repeat))
+        results[name] = best / args.number
+        print(f"{name:>10}: {results[name] * 1000:.2f} ms per page")
+    print(f"{'speedup':>10}: {results['serializer'] / results['values']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
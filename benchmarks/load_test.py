@@ -0,0 +1,142 @@
+"""
+Throughput and latency of the same endpoints behind a WSGI and an ASGI
+server. Every URL gets `--concurrency` keep-alive connections issuing
+requests back to back for `--duration` seconds.
+
+The servers aren't project dependencies, so install them first and point
+both at the same database:
+
+    pip install gunicorn uvicorn
+    gunicorn blog_drf.wsgi -b 127.0.0.1:8001 -w 1 --threads 32
+    uvicorn blog_drf.asgi:application --port 8002 --no-access-log
+    python benchmarks/load_test.py --concurrency 200 \\
+        http://127.0.0.1:8001/posts/ http://127.0.0.1:8002/posts/
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection to the host of `url`."""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.netloc = parts.netloc
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        self.path = path
+        self.reader = self.writer = None
+
+    async def get(self) -> int:
+        status, _ = await self.request("GET", self.path)
+        return status
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        body: bytes = b"",
+    ) -> tuple[int, dict[str, str]]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        head = {"Host": self.netloc, "Accept": "application/json"}
+        head.update(headers or {})
+        if body:
+            head["Content-Length"] = str(len(body))
+        lines = "".join(f"{name}: {value}\r\n" for name, value in head.items())
+        self.writer.write(f"{method} {path} HTTP/1.1\r\n{lines}\r\n".encode() + body)
+
+        status, headers = await self.__read_head()
+        if headers.get("transfer-encoding") == "chunked":
+            await self.__read_chunked()
+        else:
+            await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection") == "close":
+            await self.close()
+        return status, headers
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def __read_head(self) -> tuple[int, dict[str, str]]:
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        status_line, *lines = head.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in filter(None, lines):
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+        return int(status_line.split()[1]), headers
+
+    async def __read_chunked(self) -> None:
+        while True:
+            size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await self.reader.readexactly(size + 2)
+            if size == 0:
+                return
+
+
+async def worker(url: str, deadline: float, latencies: list, errors: list) -> None:
+    client = Client(url)
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            status = await client.get()
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            errors.append(type(exc).__name__)
+            await client.close()
+            continue
+        if status >= 400:
+            errors.append(str(status))
+        else:
+            latencies.append(time.perf_counter() - started)
+    await client.close()
+
+
+async def run(url: str, concurrency: int, duration: float) -> None:
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            worker(url, started + duration, latencies, errors)
+            for _ in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    print(url)
+    print(f"  {len(latencies) / elapsed:10.1f} requests/s, {len(errors)} errors")
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"  latency p50 {percentiles[49] * 1000:.1f} ms, "
+            f"p99 {percentiles[98] * 1000:.1f} ms, "
+            f"max {max(latencies) * 1000:.1f} ms"
+        )
+    if errors:
+        print(f"  errors: {', '.join(sorted(set(errors)))}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args()
+
+    for url in args.urls:
+        asyncio.run(run(url, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-request cost of MetricsMiddleware: the middleware around a view that
+returns at once, against calling that view directly, and the cost of
+recording alone.
+
+    python benchmarks/metrics_overhead.py
+"""
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog_drf.settings")
+django.setup()
+
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.urls import resolve  # noqa: E402
+
+from blog_drf.metrics import Metrics  # noqa: E402
+from blog_drf.middleware import MetricsMiddleware  # noqa: E402
+
+
+def measure(name: str, func, number: int, repeat: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{name:>24}: {best * 1_000_000:8.2f} µs")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    request = RequestFactory().get("/posts/")
+    request.resolver_match = resolve("/posts/")
+    response = HttpResponse(b"{}" * 1000)
+
+    def view(request):
+        return response
+
+    middleware = MetricsMiddleware(view)
+    metrics = Metrics()
+    key = ("posts.views.post_viewset.PostViewSet.list", "GET", "200")
+
+    bare = measure("view", lambda: view(request), args.number, args.repeat)
+    wrapped = measure(
+        "middleware + view", lambda: middleware(request), args.number, args.repeat
+    )
+    measure(
+        "record",
+        lambda: metrics.record(key, 0.012, 2000, 0.003, 2),
+        args.number,
+        args.repeat,
+    )
+    print(f"{'overhead':>24}: {(wrapped - bare) * 1_000_000:8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
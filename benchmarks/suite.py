@@ -0,0 +1,322 @@
+"""
+Drives every endpoint of a running server with concurrent keep-alive
+clients and writes, per scenario, throughput, p50/p95/p99 latency and the
+queries per request to a JSON file that can be diffed between commits.
+
+Seed a dataset, start the server against the same database with query
+headers on, then run the suite from the project root, which it needs for
+picking ids and creating sessions:
+
+    python manage.py seed --users 100000 --posts 5000000
+    QUERY_STATS_HEADERS=True gunicorn blog_drf.wsgi -b 127.0.0.1:8000 \\
+        -w 1 --threads 32
+    python benchmarks/suite.py http://127.0.0.1:8000 --output before.json
+    # ... check out another commit and restart the server ...
+    python benchmarks/suite.py http://127.0.0.1:8000 --output after.json \\
+        --baseline before.json
+
+The clients run in this process, so on a small machine they compete with
+the server for CPU; compare runs made on the same machine.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog_drf.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import (  # noqa: E402
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+)
+from django.contrib.auth.models import User  # noqa: E402
+from django.contrib.sessions.backends.db import SessionStore  # noqa: E402
+from django.db.models import Count  # noqa: E402
+from django.utils.crypto import get_random_string  # noqa: E402
+from load_test import Client  # noqa: E402
+
+from blog_drf.pagination import SignedCursorPagination  # noqa: E402
+from posts.models import Category, Post, Profile  # noqa: E402
+
+
+@dataclass
+class Scenario:
+    name: str
+    paths: list[str]
+    method: str = "GET"
+    authenticated: bool = False
+    body: bytes = b""
+
+
+@dataclass
+class Result:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    elapsed: float = 0
+
+
+class Suite:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+
+    def get_scenarios(self) -> list[Scenario]:
+        depth = self.args.depth
+        deep_post = Post.objects.order_by("id").only("id")[depth : depth + 1].get()
+        deep_cursor = SignedCursorPagination().get_link_after("/posts/", deep_post)
+        post_ids = self.__sample(Post.objects.values_list("id", flat=True))
+        # The most prolific authors, whose pages embed the most posts.
+        author_ids = list(
+            User.objects.annotate(count=Count("posts"))
+            .order_by("-count")
+            .values_list("id", flat=True)[:100]
+            if self.args.top_authors
+            else self.__sample(User.objects.values_list("id", flat=True))
+        )
+        return [
+            Scenario("posts-first-page", ["/posts/"]),
+            Scenario("posts-deep-cursor", [deep_cursor]),
+            Scenario("posts-first-page-number", ["/posts/?page=1"]),
+            Scenario("posts-deep-page-number", [f"/posts/?page={depth // 30 + 1}"]),
+            Scenario("post-detail", [f"/posts/{id}/" for id in post_ids]),
+            Scenario(
+                "user-detail",
+                [f"/users/{id}/" for id in author_ids],
+                authenticated=True,
+            ),
+            # Every client writes its own profile, see __get_client_users().
+            Scenario(
+                "profile-write",
+                ["/users/{user_id}/profile/"],
+                method="PATCH",
+                authenticated=True,
+                body=json.dumps({"bio": "benchmark"}).encode(),
+            ),
+            Scenario("categories", ["/categories/"]),
+        ]
+
+    def run(self) -> dict:
+        scenarios = [
+            scenario
+            for scenario in self.get_scenarios()
+            if not self.args.scenarios or scenario.name in self.args.scenarios
+        ]
+        client_users = self.__get_client_users()
+        report = {
+            "meta": {
+                "commit": self.__get_commit(),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "url": self.args.url,
+                "concurrency": self.args.concurrency,
+                "duration": self.args.duration,
+                "dataset": {
+                    "users": User.objects.count(),
+                    "posts": Post.objects.count(),
+                    "categories": Category.objects.count(),
+                    "profiles": Profile.objects.count(),
+                },
+            },
+            "scenarios": {},
+        }
+        for scenario in scenarios:
+            result = asyncio.run(self.__run_scenario(scenario, client_users))
+            report["scenarios"][scenario.name] = summary = self.__summarize(result)
+            print(f"{scenario.name:28} {self.__format(summary)}")
+        return report
+
+    async def __run_scenario(self, scenario: Scenario, client_users) -> Result:
+        result = Result()
+        if self.args.warmup:
+            await self.__drive(scenario, client_users, self.args.warmup, Result())
+        await self.__drive(scenario, client_users, self.args.duration, result)
+        result.elapsed = self.args.duration
+        return result
+
+    async def __drive(self, scenario, client_users, duration: float, result) -> None:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(self.__worker(scenario, user, deadline, result) for user in client_users)
+        )
+
+    async def __worker(self, scenario: Scenario, user, deadline, result) -> None:
+        user_id, session_key, csrf_token = user
+        rng = random.Random(f"{self.args.seed}-{user_id}")
+        client = Client(self.args.url)
+        headers = {}
+        if scenario.authenticated:
+            headers["Cookie"] = (
+                f"{settings.SESSION_COOKIE_NAME}={session_key}; "
+                f"{settings.CSRF_COOKIE_NAME}={csrf_token}"
+            )
+            headers["X-CSRFToken"] = csrf_token
+        if scenario.body:
+            headers["Content-Type"] = "application/json"
+
+        while time.perf_counter() < deadline:
+            path = rng.choice(scenario.paths).format(user_id=user_id)
+            started = time.perf_counter()
+            try:
+                status, response_headers = await client.request(
+                    scenario.method, path, headers, scenario.body
+                )
+            except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                result.errors.append(type(exc).__name__)
+                await client.close()
+                continue
+            if status >= 400:
+                result.errors.append(str(status))
+                continue
+            result.latencies.append(time.perf_counter() - started)
+            if "x-db-query-count" in response_headers:
+                result.queries.append(int(response_headers["x-db-query-count"]))
+        await client.close()
+
+    def __get_client_users(self) -> list[tuple[int, str, str]]:
+        # One user per client, each with a profile and a session.
+        users = list(
+            User.objects.filter(is_active=True).order_by("id")[: self.args.concurrency]
+        )
+        if len(users) < self.args.concurrency:
+            raise SystemExit("Seed at least --concurrency users first.")
+        client_users = []
+        for user in users:
+            Profile.objects.get_or_create(owner=user)
+            session = SessionStore()
+            session[SESSION_KEY] = str(user.pk)
+            session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+            session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+            session.create()
+            client_users.append((user.pk, session.session_key, get_random_string(32)))
+        return client_users
+
+    def __sample(self, values_list) -> list[int]:
+        ids = list(values_list.order_by("?")[: self.args.sample])
+        self.rng.shuffle(ids)
+        return ids
+
+    @staticmethod
+    def __summarize(result: Result) -> dict:
+        latencies = sorted(result.latencies)
+        summary = {
+            "requests": len(latencies),
+            "requests_per_second": round(len(latencies) / result.elapsed, 1),
+            "errors": len(result.errors),
+            "error_kinds": sorted(set(result.errors)),
+        }
+        if len(latencies) > 1:
+            percentiles = statistics.quantiles(latencies, n=100)
+            summary["latency_ms"] = {
+                "p50": round(percentiles[49] * 1000, 2),
+                "p95": round(percentiles[94] * 1000, 2),
+                "p99": round(percentiles[98] * 1000, 2),
+                "max": round(latencies[-1] * 1000, 2),
+            }
+        if result.queries:
+            summary["queries"] = {
+                "mean": round(statistics.fmean(result.queries), 2),
+                "max": max(result.queries),
+            }
+        return summary
+
+    @staticmethod
+    def __format(summary: dict) -> str:
+        text = f"{summary['requests_per_second']:8.1f} req/s"
+        if "latency_ms" in summary:
+            latency = summary["latency_ms"]
+            text += (
+                f"  p50 {latency['p50']:8.1f} ms  p95 {latency['p95']:8.1f} ms"
+                f"  p99 {latency['p99']:8.1f} ms"
+            )
+        if "queries" in summary:
+            text += f"  {summary['queries']['mean']:5.1f} queries"
+        if summary["errors"]:
+            text += (
+                f"  {summary['errors']} errors ({', '.join(summary['error_kinds'])})"
+            )
+        return text
+
+    @staticmethod
+    def __get_commit() -> str | None:
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+
+def compare(report: dict, baseline: dict) -> None:
+    print(f"\nCompared with {baseline['meta'].get('commit')}:")
+    for name, summary in report["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if not before or "latency_ms" not in before or "latency_ms" not in summary:
+            continue
+        changes = [
+            f"{key} {change(before['latency_ms'][key], summary['latency_ms'][key])}"
+            for key in ("p50", "p99")
+        ]
+        changes.append(
+            "req/s "
+            + change(before["requests_per_second"], summary["requests_per_second"])
+        )
+        print(f"{name:28} {'  '.join(changes)}")
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+6.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "url", help="Base URL of the server, e.g. http://127.0.0.1:8000"
+    )
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", help="An earlier --output to compare with.")
+    parser.add_argument("--scenarios", nargs="*", help="Only run these scenarios.")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--warmup", type=float, default=3)
+    parser.add_argument(
+        "--depth", type=int, default=100_000, help="Posts before the deep pages."
+    )
+    parser.add_argument(
+        "--sample", type=int, default=1000, help="Ids to spread detail requests over."
+    )
+    parser.add_argument(
+        "--top-authors",
+        action="store_true",
+        help="Request the biggest authors in user-detail, instead of a sample.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = Suite(args).run()
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Wrote {args.output}.")
+    if args.baseline:
+        compare(report, json.loads(Path(args.baseline).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    """Queries made while recording: how many, for how long, and which."""
+
+    def __init__(self, parent: "QueryStats | None" = None):
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def add(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[sql] += 1
+        if self.parent is not None:
+            self.parent.add(sql, duration)
+
+    @property
+    def duplicates(self) -> int:
+        # Repeated statements, whatever their parameters, i.e. N+1 queries.
+        return self.count - len(self.statements)
+
+    def get_duplicated(self, limit: int = 3) -> list[tuple[str, int]]:
+        return [
+            (sql, count)
+            for sql, count in self.statements.most_common(limit)
+            if count > 1
+        ]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    stats = query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add(sql, time.perf_counter() - started)
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs) -> None:
+    # Wrappers outlive their connections, so this only happens once each.
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def recording_queries() -> Iterator[QueryStats]:
+    """
+    Records the queries of every database made in this context, including
+    the threads and tasks it starts. Enclosing recordings see them too.
+    """
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(None, connection)
+    stats = QueryStats(parent=query_stats.get())
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
@@ -0,0 +1,118 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from psycopg import IsolationLevel
+from psycopg_pool import ConnectionPool
+
+from .creation import DatabaseCreation
+
+# Counters psycopg_pool only reports once they are non-zero.
+POOL_COUNTERS = (
+    "requests_num",
+    "requests_queued",
+    "requests_wait_ms",
+    "requests_errors",
+    "returns_bad",
+    "connections_num",
+    "connections_ms",
+    "connections_errors",
+    "connections_lost",
+    "usage_ms",
+)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    Django's PostgreSQL backend, drawing connections from a psycopg pool
+    shared by all threads of the process when OPTIONS["pool"] is True or a
+    dict of ConnectionPool options, as Django 5.1 does. Closing a connection
+    returns it to the pool; CONN_HEALTH_CHECKS checks it on every checkout.
+    """
+
+    creation_class = DatabaseCreation
+    _connection_pools = {}
+    __connection_pool = None
+
+    @property
+    def pool(self) -> ConnectionPool | None:
+        pool_options = self.settings_dict["OPTIONS"].get("pool")
+        if self.alias == NO_DB_ALIAS or not pool_options:
+            return None
+
+        if self.alias not in self._connection_pools:
+            if self.settings_dict["CONN_MAX_AGE"] != 0:
+                raise ImproperlyConfigured(
+                    "Pooled connections can't be persistent, set CONN_MAX_AGE to 0."
+                )
+            params = self.get_connection_params()
+            # Django sets autocommit itself once a connection is checked out.
+            params["autocommit"] = True
+            pool = ConnectionPool(
+                kwargs=params,
+                open=False,
+                check=(
+                    ConnectionPool.check_connection
+                    if self.settings_dict["CONN_HEALTH_CHECKS"]
+                    else None
+                ),
+                name=self.alias,
+                **({} if pool_options is True else pool_options),
+            )
+            # Threads may race to create it; the first one wins.
+            self._connection_pools.setdefault(self.alias, pool)
+        return self._connection_pools[self.alias]
+
+    def close_pool(self) -> None:
+        pool = self._connection_pools.pop(self.alias, None)
+        if pool is not None:
+            pool.close()
+
+    def get_pool_stats(self) -> dict | None:
+        pool = self.pool
+        if pool is None:
+            return None
+        stats = dict.fromkeys(POOL_COUNTERS, 0) | pool.get_stats()
+        requests = stats["requests_num"]
+        stats["requests_wait_ms_avg"] = (
+            stats["requests_wait_ms"] / requests if requests else 0.0
+        )
+        return stats
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("pool", None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        pool.open()
+        connection = pool.getconn()
+        # The connection goes back to the pool it came from, even if the
+        # pool has been replaced in the meantime.
+        self.__connection_pool = pool
+        # Set up as the parent's get_new_connection() would.
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = IsolationLevel(
+                isolation_level or IsolationLevel.READ_COMMITTED
+            )
+        except ValueError:
+            pool.putconn(connection)
+            raise ImproperlyConfigured(
+                f"Invalid transaction isolation level {isolation_level} "
+                f"specified. Use one of the psycopg.IsolationLevel values."
+            ) from None
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        pool = self.__connection_pool
+        if self.connection is None or pool is None:
+            return super()._close()
+        self.__connection_pool = None
+        with self.wrap_database_errors:
+            pool.putconn(self.connection)
@@ -0,0 +1,53 @@
+from collections.abc import Callable
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS
+
+
+class LazyDatabase:
+    """
+    The alias returned by `pick`, called on the first read that needs it, so
+    requests that never query don't connect to anything.
+    """
+
+    def __init__(self, pick: Callable[[], str | None]):
+        self.__pick = pick
+        self.__picked = False
+        self.__alias = None
+
+    @property
+    def alias(self) -> str | None:
+        if not self.__picked:
+            self.__alias = self.__pick()
+            self.__picked = True
+        return self.__alias
+
+
+# Set per request by ReplicaRoutingMiddleware.
+read_database: ContextVar[str | LazyDatabase | None] = ContextVar(
+    "read_database", default=None
+)
+
+
+class PrimaryReplicaRouter:
+    """
+    Reads go to the database in `read_database` when it is set, and
+    everything else, migrations included, to the primary. Replicas hold
+    the primary's rows, so objects from either may be related.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        database = read_database.get()
+        if isinstance(database, LazyDatabase):
+            return database.alias
+        return database
+
+    def db_for_write(self, model, **hints) -> str:
+        # Even for objects that were read from a replica.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
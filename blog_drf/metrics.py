@@ -0,0 +1,191 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+
+from django.conf import settings
+
+# Upper bounds, in seconds, of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Positions in the values recorded per (view, method, status).
+COUNTS = slice(0, len(LATENCY_BUCKETS) + 1)
+DURATION = len(LATENCY_BUCKETS) + 1
+SIZED = DURATION + 1
+SIZE = DURATION + 2
+DB_DURATION = DURATION + 3
+QUERIES = DURATION + 4
+VALUES_LENGTH = DURATION + 5
+
+Key = tuple[str, str, str]
+
+
+class Metrics:
+    """
+    Request metrics of this process: per view, method and status, a latency
+    histogram, response sizes and database time.
+
+    Every thread records into its own shard, which only it writes to, so
+    recording takes no lock; shards are summed when exported. With
+    `settings.METRICS_DIR`, each process also writes its metrics there every
+    `METRICS_FLUSH_SECONDS` and on exit, and `collect()` sums the files of
+    all processes, so any pre-forked worker can serve the metrics of them
+    all. Files of exited workers are kept, so their counts aren't lost; the
+    directory has to be emptied when the server starts.
+    """
+
+    def __init__(self):
+        self.__reset()
+        os.register_at_fork(after_in_child=self.__reset)
+        atexit.register(self.__flush_on_exit)
+
+    def record(
+        self,
+        key: Key,
+        duration: float,
+        size: int | None,
+        db_duration: float,
+        queries: int,
+    ) -> None:
+        try:
+            shard = self.__local.shard
+        except AttributeError:
+            shard = self.__add_shard()
+        values = shard.get(key)
+        if values is None:
+            values = shard[key] = [0] * VALUES_LENGTH
+        values[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        values[DURATION] += duration
+        if size is not None:
+            values[SIZED] += 1
+            values[SIZE] += size
+        values[DB_DURATION] += db_duration
+        values[QUERIES] += queries
+
+    def snapshot(self) -> dict[Key, list]:
+        # A shard may gain keys while it's copied; dict.copy() holds the GIL.
+        return merge(shard.copy() for shard in list(self.__shards))
+
+    def collect(self) -> dict[Key, list]:
+        if not settings.METRICS_DIR:
+            return self.snapshot()
+        self.flush()
+        snapshots = []
+        for path in Path(settings.METRICS_DIR).glob("*.json"):
+            try:
+                rows = json.loads(path.read_text())
+            except (OSError, ValueError):
+                # Removed, or not completely written, by another process.
+                continue
+            snapshots.append({tuple(key): values for *key, values in rows})
+        return merge(snapshots)
+
+    def flush(self) -> None:
+        rows = [[*key, values] for key, values in self.snapshot().items()]
+        directory = Path(settings.METRICS_DIR)
+        path = directory / f"{os.getpid()}.json"
+        temporary = directory / f".{os.getpid()}.tmp"
+        temporary.write_text(json.dumps(rows))
+        # Readers see either the previous file or this one, never a partial.
+        os.replace(temporary, path)
+
+    def __add_shard(self) -> dict:
+        with self.__lock:
+            shard = self.__local.shard = {}
+            self.__shards.append(shard)
+            if settings.METRICS_DIR and self.__flusher is None:
+                self.__flusher = threading.Thread(
+                    target=self.__flush_periodically, name="metrics", daemon=True
+                )
+                self.__flusher.start()
+        return shard
+
+    def __flush_periodically(self) -> None:
+        while True:
+            time.sleep(settings.METRICS_FLUSH_SECONDS)
+            if settings.METRICS_DIR:
+                self.flush()
+
+    def __flush_on_exit(self) -> None:
+        if self.__shards and settings.configured and settings.METRICS_DIR:
+            self.flush()
+
+    def __reset(self) -> None:
+        # Forked workers start from nothing, with no flusher thread.
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__shards = []
+        self.__flusher = None
+
+
+def merge(snapshots: Iterable[dict[Key, list]]) -> dict[Key, list]:
+    merged = {}
+    for snapshot in snapshots:
+        for key, values in snapshot.items():
+            total = merged.setdefault(key, [0] * VALUES_LENGTH)
+            for position, value in enumerate(values):
+                total[position] += value
+    return merged
+
+
+def render(snapshot: dict[Key, list]) -> str:
+    """The metrics in the Prometheus text exposition format."""
+    rows = sorted(snapshot.items())
+    lines = [
+        "# HELP blog_drf_request_duration_seconds Request latency, per view.",
+        "# TYPE blog_drf_request_duration_seconds histogram",
+    ]
+    for key, values in rows:
+        labels = get_labels(key)
+        cumulative = 0
+        for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), values[COUNTS]):
+            cumulative += count
+            lines.append(
+                f'blog_drf_request_duration_seconds_bucket{{{labels},le="{bound}"}}'
+                f" {cumulative}"
+            )
+        lines.append(
+            f"blog_drf_request_duration_seconds_sum{{{labels}}} {values[DURATION]}"
+        )
+        lines.append(
+            f"blog_drf_request_duration_seconds_count{{{labels}}} {cumulative}"
+        )
+
+    lines += [
+        "# HELP blog_drf_response_size_bytes Size of non-streaming responses.",
+        "# TYPE blog_drf_response_size_bytes summary",
+    ]
+    for key, values in rows:
+        labels = get_labels(key)
+        lines.append(f"blog_drf_response_size_bytes_sum{{{labels}}} {values[SIZE]}")
+        lines.append(f"blog_drf_response_size_bytes_count{{{labels}}} {values[SIZED]}")
+
+    for name, position, description in (
+        ("db_duration_seconds_total", DB_DURATION, "Time spent in queries."),
+        ("db_queries_total", QUERIES, "Queries made."),
+    ):
+        lines += [
+            f"# HELP blog_drf_{name} {description}",
+            f"# TYPE blog_drf_{name} counter",
+        ]
+        for key, values in rows:
+            lines.append(f"blog_drf_{name}{{{get_labels(key)}}} {values[position]}")
+    return "\n".join(lines) + "\n"
+
+
+def get_labels(key: Key) -> str:
+    return ",".join(
+        f'{name}="{escape(value)}"'
+        for name, value in zip(("view", "method", "status"), key)
+    )
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+metrics = Metrics()
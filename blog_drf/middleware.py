@@ -0,0 +1,257 @@
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+from blog_drf.db.instrumentation import QueryBudgetExceeded, recording_queries
+from blog_drf.db.routers import LazyDatabase, read_database
+from blog_drf.metrics import metrics
+
+logger = logging.getLogger(__name__)
+query_logger = logging.getLogger("blog_drf.queries")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Routes the reads of safe requests to one of `settings.DATABASE_REPLICAS`,
+    picked when the request first reads, skipping replicas that can't be
+    connected to for `REPLICA_RETRY_SECONDS`, and falling back to the primary.
+
+    Writes that succeed set a cookie keeping the client's reads on the
+    primary for `REPLICA_STICKY_SECONDS`, so it sees its own changes despite
+    replication lag.
+    """
+
+    sync_capable = True
+    async_capable = True
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+    cookie_name = "read_primary"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.replicas_down_until = {}
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = read_database.set(self.__get_read_database(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            read_database.reset(token)
+        return self.__set_cookie(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = read_database.set(self.__get_read_database(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_database.reset(token)
+        return self.__set_cookie(request, response)
+
+    def __get_read_database(self, request: HttpRequest) -> LazyDatabase | None:
+        if (
+            not settings.DATABASE_REPLICAS
+            or request.method not in self.safe_methods
+            or self.cookie_name in request.COOKIES
+            # Rows written in an open transaction are only on its connection.
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return None
+        return LazyDatabase(self.__pick_replica)
+
+    def __pick_replica(self) -> str | None:
+        replicas = settings.DATABASE_REPLICAS
+        for alias in random.sample(replicas, len(replicas)):
+            if self.__is_available(alias):
+                return alias
+        return None
+
+    def __is_available(self, alias: str) -> bool:
+        if self.replicas_down_until.get(alias, 0) > time.monotonic():
+            return False
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError:
+            logger.warning("Replica %r is unavailable.", alias, exc_info=True)
+            self.replicas_down_until[alias] = (
+                time.monotonic() + settings.REPLICA_RETRY_SECONDS
+            )
+            return False
+        return True
+
+    def __set_cookie(self, request: HttpRequest, response: HttpResponse):
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method not in self.safe_methods
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Records the queries of each request: their number, total time and the
+    statements repeated within it. They're logged to `blog_drf.queries`,
+    with the numbers as record attributes for structured handlers, and sent
+    back as `X-DB-*` headers if QUERY_STATS_HEADERS is set, as it is with
+    DEBUG.
+
+    Views may set a `query_budget`, either a number or one per action (or
+    per method for plain APIViews). Requests over it are logged as
+    warnings, or fail with QueryBudgetExceeded if QUERY_BUDGETS_RAISE is set,
+    as it is in tests. Queries made while streaming a response aren't seen.
+    The stats are left on `request.query_stats` for outer middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with recording_queries() as stats:
+            request.query_stats = stats
+            response = self.get_response(request)
+        return self.__report(request, response, stats)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with recording_queries() as stats:
+            request.query_stats = stats
+            response = await self.get_response(request)
+        return self.__report(request, response, stats)
+
+    def __report(self, request: HttpRequest, response: HttpResponse, stats):
+        view, budget = self.__get_view_budget(request)
+        duration_ms = round(stats.duration * 1000, 3)
+        if settings.QUERY_STATS_HEADERS:
+            response["X-DB-Query-Count"] = str(stats.count)
+            response["X-DB-Query-Time"] = f"{duration_ms:.3f}"
+            response["X-DB-Duplicate-Queries"] = str(stats.duplicates)
+
+        extra = {
+            "view": view,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "query_count": stats.count,
+            "query_time_ms": duration_ms,
+            "duplicate_queries": stats.duplicates,
+            "duplicated_statements": stats.get_duplicated(),
+        }
+        query_logger.info(
+            "%s %s: %d queries in %.1f ms, %d duplicates",
+            request.method,
+            request.path,
+            stats.count,
+            duration_ms,
+            stats.duplicates,
+            extra=extra,
+        )
+        if budget is not None and stats.count > budget:
+            message = (
+                f"{view} made {stats.count} queries, over its budget of {budget}"
+                f" ({stats.duplicates} duplicates)."
+            )
+            if settings.QUERY_BUDGETS_RAISE:
+                raise QueryBudgetExceeded(message)
+            query_logger.warning(message, extra=extra)
+        return response
+
+    @staticmethod
+    def __get_view_budget(request: HttpRequest) -> tuple[str | None, int | None]:
+        name, view_class, handler = get_view(request)
+        budget = getattr(view_class, "query_budget", None)
+        if isinstance(budget, dict):
+            budget = budget.get(handler)
+        return name, budget
+
+
+class MetricsMiddleware:
+    """
+    Records the latency, response size and database time of every request
+    into `blog_drf.metrics.metrics`, per view, method and status. Goes
+    before QueryInstrumentationMiddleware, which provides the query stats.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.__record(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.__record(request, response, time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def __record(request: HttpRequest, response: HttpResponse, duration: float):
+        name, _, _ = get_view(request)
+        stats = getattr(request, "query_stats", None)
+        metrics.record(
+            (name or "", get_method(request).upper(), str(response.status_code)),
+            duration,
+            None if response.streaming else len(response.content),
+            stats.duration if stats is not None else 0.0,
+            stats.count if stats is not None else 0,
+        )
+
+
+def get_view(request: HttpRequest) -> tuple[str | None, type | None, str | None]:
+    """
+    The resolved view of the request as `<module>.<class>.<action>`, or
+    `<module>.<function>.<method>`, its class and its action or method.
+    """
+    match = request.resolver_match
+    if match is None:
+        return None, None, None
+    view = match.func
+    view_class = getattr(view, "cls", None) or getattr(view, "view_class", None)
+    # A viewset's action for this method, or else the method itself.
+    actions = getattr(view, "actions", None) or {}
+    method = get_method(request)
+    handler = actions.get(method, method)
+    return f"{match._func_path}.{handler}", view_class, handler
+
+
+def get_method(request: HttpRequest) -> str:
+    """
+    The request's method in lower case, or "other" for one HTTP doesn't
+    define, so clients can't make up names for metrics without bound.
+    """
+    method = request.method.lower()
+    return method if method in View.http_method_names else "other"
@@ -1,7 +1,146 @@
+from django.core import signing
+from django.utils.translation import gettext_lazy as _
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import Cursor
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomPageSizePageNumberPagination(pagination.PageNumberPagination):
     page_size = 30
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class SignedCursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination: every page is a `WHERE <key> > <position> LIMIT n` query,
+    so fetching a page costs the same regardless of its depth and no COUNT(*)
+    is issued. Cursors are signed, so clients can't forge arbitrary positions.
+    """
+
+    page_size = 30
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering_query_param = "ordering"
+    orderings = {
+        "id": ("id",),
+        "-id": ("-id",),
+        "created_at": ("created_at", "id"),
+        "-created_at": ("-created_at", "-id"),
+    }
+    default_ordering = "id"
+    invalid_ordering_message = _("Unsupported ordering. Expected one of: {choices}.")
+    cursor_salt = "blog_drf.pagination.SignedCursorPagination"
+
+    def get_ordering(self, request, queryset, view):
+        self.ordering_key = request.query_params.get(
+            self.ordering_query_param,
+            self.default_ordering,
+        )
+        try:
+            return self.orderings[self.ordering_key]
+        except KeyError as exc:
+            message = self.invalid_ordering_message.format(
+                choices=", ".join(self.orderings)
+            )
+            raise ValidationError({self.ordering_query_param: [message]}) from exc
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            tokens = signing.loads(encoded, salt=self.cursor_salt)
+            offset = int(tokens.get("o", 0))
+            reverse = bool(tokens.get("r", False))
+            position = tokens.get("p")
+            ordering_key = tokens["k"]
+        except (signing.BadSignature, TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message) from None
+
+        # A cursor only makes sense for the ordering it was issued for.
+        if offset < 0 or ordering_key != self.ordering_key:
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(
+            offset=min(offset, self.offset_cutoff),
+            reverse=reverse,
+            position=position,
+        )
+
+    def encode_cursor(self, cursor):
+        tokens = {"k": self.ordering_key}
+        if cursor.offset != 0:
+            tokens["o"] = cursor.offset
+        if cursor.reverse:
+            tokens["r"] = True
+        if cursor.position is not None:
+            tokens["p"] = cursor.position
+
+        encoded = signing.dumps(tokens, salt=self.cursor_salt, compress=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_link_after(self, base_url, instance):
+        """
+        Link to the page of `base_url` that follows `instance` in the default
+        ordering, for responses that embed the first page of a collection.
+        """
+        self.base_url = base_url
+        self.ordering_key = self.default_ordering
+        ordering = self.orderings[self.ordering_key]
+        position = self._get_position_from_instance(instance, ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+
+class CursorOrPageNumberPagination(pagination.BasePagination):
+    """
+    Keyset pagination by default, while clients that pass `page` keep the
+    classic `count`/`page`/`page_size` contract.
+
+    Cursors impose their own ordering, so querysets that were explicitly
+    ordered (e.g. ranked search results) are paginated by page number.
+    """
+
+    cursor_pagination_class = SignedCursorPagination
+    page_number_pagination_class = CustomPageSizePageNumberPagination
+
+    def __init__(self):
+        self.paginator = self.cursor_pagination_class()
+
+    @property
+    def display_page_controls(self):
+        return self.paginator.display_page_controls
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.get_paginator(request, queryset)
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginator(self, request, queryset):
+        page_number_class = self.page_number_pagination_class
+        if (
+            page_number_class.page_query_param in request.query_params
+            or queryset.query.order_by
+        ):
+            return page_number_class()
+        return self.cursor_pagination_class()
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.cursor_pagination_class().get_paginated_response_schema(schema)
+
+    def to_html(self):
+        return self.paginator.to_html()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = {}
+        for paginator_class in (
+            self.cursor_pagination_class,
+            self.page_number_pagination_class,
+        ):
+            for parameter in paginator_class().get_schema_operation_parameters(view):
+                parameters.setdefault(parameter["name"], parameter)
+        return list(parameters.values())
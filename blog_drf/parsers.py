@@ -0,0 +1,40 @@
+import codecs
+
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from blog_drf.renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONParser(parsers.JSONParser):
+    """
+    DRF's JSONParser on top of orjson when it's installed. orjson only reads
+    UTF-8 and always rejects NaN and infinity, so other encodings and
+    non-strict parsing stay on the stdlib.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or not self.__is_utf8(encoding):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
+
+    @staticmethod
+    def __is_utf8(encoding: str) -> bool:
+        try:
+            return codecs.lookup(encoding).name == "utf-8"
+        except LookupError:
+            return False
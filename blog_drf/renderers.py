@@ -0,0 +1,47 @@
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    DRF's JSONRenderer on top of orjson when it's installed, which encodes
+    dicts, lists, datetimes and UUIDs natively; anything else, e.g. decimals
+    or lazy translations, goes through `encoder_class().default`.
+
+    The output is byte-for-byte DRF's compact UTF-8 JSON. Indented or ASCII
+    output, and values orjson can't encode (e.g. integers over 64 bits), are
+    rendered by the stdlib instead. Unlike the stdlib, NaN and infinity are
+    written as null rather than rejected.
+    """
+
+    orjson_options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=self.orjson_options,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escaped like DRF does, to keep the output a strict JavaScript subset.
+        # Both are multibyte, so ASCII output (checked in C) can't hold them.
+        if not ret.isascii():
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
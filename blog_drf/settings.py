@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 
-from decouple import Config, RepositoryEnv
+from decouple import Config, Csv, RepositoryEnv
 
 config = Config(RepositoryEnv(".env"))
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -46,6 +46,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "blog_drf.middleware.MetricsMiddleware",
+    "blog_drf.middleware.QueryInstrumentationMiddleware",
+    "blog_drf.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -80,12 +83,77 @@ WSGI_APPLICATION = "blog_drf.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        # Django's backend, plus the optional pool below.
+        "ENGINE": "blog_drf.db.postgresql",
         "NAME": config("POSTGRES_DB"),
         "USER": config("POSTGRES_USERNAME"),
         "PASSWORD": config("POSTGRES_PASSWORD"),
         "HOST": config("POSTGRES_HOST"),
         "PORT": config("POSTGRES_PORT"),
+        # Seconds each thread keeps its connection open between requests;
+        # 0 closes it after every request, which pooling requires.
+        "CONN_MAX_AGE": config("CONN_MAX_AGE", default=0, cast=int),
+        "CONN_HEALTH_CHECKS": config("CONN_HEALTH_CHECKS", default=True, cast=bool),
+        "OPTIONS": {},
+    }
+}
+
+# One pool of connections per process, shared by its threads. Statistics
+# are served to staff at /db-pools/.
+if config("DB_POOL", default=False, cast=bool):
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+        "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+        # Seconds to wait for a free connection before failing the request.
+        "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+        # Seconds after which connections are replaced, and closed if idle.
+        "max_lifetime": config("DB_POOL_MAX_LIFETIME", default=1800, cast=float),
+        "max_idle": config("DB_POOL_MAX_IDLE", default=600, cast=float),
+    }
+
+# Read replicas, as "host[:port][/name]" entries sharing the primary's
+# credentials. Reads of safe requests go to a random one that is reachable,
+# except for clients that wrote in the last REPLICA_STICKY_SECONDS; replicas
+# that fail to connect are left out for REPLICA_RETRY_SECONDS.
+DATABASE_REPLICAS = []
+for number, replica in enumerate(
+    config("POSTGRES_REPLICAS", default="", cast=Csv()), start=1
+):
+    address, _, name = replica.partition("/")
+    host, _, port = address.partition(":")
+    alias = f"replica{number}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "NAME": name or DATABASES["default"]["NAME"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "OPTIONS": {
+            **DATABASES["default"]["OPTIONS"],
+            "connect_timeout": config(
+                "POSTGRES_REPLICA_CONNECT_TIMEOUT", default=2, cast=int
+            ),
+        },
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["blog_drf.db.routers.PrimaryReplicaRouter"]
+REPLICA_STICKY_SECONDS = config("REPLICA_STICKY_SECONDS", default=10, cast=int)
+REPLICA_RETRY_SECONDS = config("REPLICA_RETRY_SECONDS", default=30, cast=int)
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Cached responses are invalidated by bumping a shared version key, so every
+# process must see the same cache: use Redis or Memcached in production.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND",
+            default="django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
     }
 }
 
@@ -131,6 +199,30 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Send each request's query count and time back in `X-DB-*` headers, e.g.
+# for the benchmark suite.
+QUERY_STATS_HEADERS = config("QUERY_STATS_HEADERS", default=DEBUG, cast=bool)
+# Fail requests over their view's `query_budget` instead of logging them.
+QUERY_BUDGETS_RAISE = config("QUERY_BUDGETS_RAISE", default=False, cast=bool)
+
+# Request metrics are served at /metrics, to scrapers sending METRICS_TOKEN
+# as a bearer token, or to anyone under DEBUG if it isn't set. Pre-forked
+# workers share theirs through METRICS_DIR, written every
+# METRICS_FLUSH_SECONDS; empty it on start.
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+METRICS_DIR = config("METRICS_DIR", default="")
+METRICS_FLUSH_SECONDS = config("METRICS_FLUSH_SECONDS", default=5, cast=float)
+
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "blog_drf.pagination.CustomPageSizePageNumberPagination",
+    # orjson-backed when the `fast-json` extra is installed, stdlib otherwise.
+    "DEFAULT_RENDERER_CLASSES": (
+        "blog_drf.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "blog_drf.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
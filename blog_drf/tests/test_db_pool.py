@@ -0,0 +1,64 @@
+import copy
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from rest_framework.test import APIClient
+
+from blog_drf.db.postgresql.base import DatabaseWrapper
+
+
+@pytest.fixture
+def pooled_connection():
+    settings_dict = copy.deepcopy(connection.settings_dict)
+    settings_dict["OPTIONS"]["pool"] = {"min_size": 1, "max_size": 1}
+    wrapper = DatabaseWrapper(settings_dict, alias="pooled")
+    yield wrapper
+    wrapper.close()
+    wrapper.close_pool()
+
+
+class TestPooledDatabaseWrapper:
+    @pytest.mark.django_db
+    def test_close_returns_connection_to_pool(self, pooled_connection):
+        pooled_connection.ensure_connection()
+        backend_pid = pooled_connection.connection.info.backend_pid
+        pooled_connection.close()
+
+        assert pooled_connection.get_pool_stats()["pool_available"] == 1
+
+        with pooled_connection.cursor() as cursor:
+            cursor.execute("SELECT pg_backend_pid()")
+            assert cursor.fetchone() == (backend_pid,)
+        stats = pooled_connection.get_pool_stats()
+        assert (stats["pool_size"], stats["requests_num"]) == (1, 2)
+        assert stats["requests_waiting"] == 0
+
+    @pytest.mark.django_db
+    def test_timezone_on_pooled_connection(self, pooled_connection):
+        with pooled_connection.cursor() as cursor:
+            cursor.execute("SHOW TIME ZONE")
+            assert cursor.fetchone() == ("UTC",)
+
+    def test_persistent_pooled_connections_error(self, pooled_connection):
+        pooled_connection.settings_dict["CONN_MAX_AGE"] = 60
+
+        with pytest.raises(ImproperlyConfigured):
+            pooled_connection.get_pool_stats()
+
+    def test_unpooled_connection(self):
+        assert connection.pool is None
+        assert connection.get_pool_stats() is None
+
+
+class TestDatabasePoolsView:
+    def test_get_by_admin(self, admin_client):
+        response = admin_client.get("/db-pools/")
+
+        assert response.status_code == 200
+        assert response.json() == {}
+
+    def test_get_by_anonymous_error(self):
+        response = APIClient().get("/db-pools/")
+
+        assert response.status_code == 403
@@ -0,0 +1,64 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from blog_drf.parsers import FastJSONParser
+from blog_drf.renderers import FastJSONRenderer
+
+
+class TestFastJSONRenderer:
+    @pytest.mark.parametrize(
+        "data",
+        (
+            {"title": "plain", "tags": ["a", "b"], "count": 3, "ok": True},
+            {"text": "non-ascii ✓ and \u2028 line \u2029 separators"},
+            {
+                "utc": datetime.datetime(
+                    2023, 1, 1, 12, 30, tzinfo=datetime.timezone.utc
+                ),
+                "local": timezone.localtime(
+                    datetime.datetime(
+                        2023, 1, 1, 12, 30, 1, 5, tzinfo=datetime.timezone.utc
+                    ),
+                    datetime.timezone(datetime.timedelta(hours=9)),
+                ),
+                "date": datetime.date(2023, 1, 1),
+            },
+            {"price": decimal.Decimal("1.50"), "id": uuid.UUID(int=1)},
+            {"lazy": gettext_lazy("Not found."), 1: "int key"},
+            {"big": 2**70},
+            [],
+        ),
+    )
+    def test_same_output_as_drf(self, data):
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_output_as_drf(self):
+        data = {"title": "indented"}
+        media_type = "application/json; indent=4"
+
+        assert FastJSONRenderer().render(data, media_type) == JSONRenderer().render(
+            data, media_type
+        )
+
+
+class TestFastJSONParser:
+    def test_same_data_as_drf(self):
+        content = '{"title": "✓", "ids": [1, 2], "nested": {"ok": null}}'.encode()
+
+        assert FastJSONParser().parse(io.BytesIO(content)) == JSONParser().parse(
+            io.BytesIO(content)
+        )
+
+    @pytest.mark.parametrize("content", (b'{"title": ', b'{"n": NaN}', b"\xff"))
+    def test_invalid_json_error(self, content):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(content))
@@ -0,0 +1,147 @@
+import json
+import os
+import re
+import threading
+
+import pytest
+from rest_framework.test import APIClient
+
+from blog_drf.metrics import Metrics, metrics, render
+from posts.tests.factories import PostFactory
+
+LIST_LABELS = (
+    'view="posts.views.post_viewset.PostViewSet.list",method="GET",status="200"'
+)
+
+
+def get_sample(text: str, name: str, labels: str) -> float:
+    match = re.search(rf"^{name}{{{re.escape(labels)}}} (\S+)$", text, re.MULTILINE)
+    return float(match[1]) if match else 0
+
+
+class TestMetrics:
+    def test_record(self):
+        recorded = Metrics()
+        key = ("view", "GET", "200")
+
+        recorded.record(key, 0.003, 100, 0.001, 2)
+        recorded.record(key, 0.2, None, 0.05, 3)
+        text = render(recorded.snapshot())
+
+        assert 'view="view",method="GET",status="200",le="0.005"} 1' in text
+        assert 'view="view",method="GET",status="200",le="0.1"} 1' in text
+        assert 'view="view",method="GET",status="200",le="0.25"} 2' in text
+        assert 'view="view",method="GET",status="200",le="+Inf"} 2' in text
+        labels = 'view="view",method="GET",status="200"'
+        assert get_sample(text, "blog_drf_request_duration_seconds_count", labels) == 2
+        assert get_sample(text, "blog_drf_response_size_bytes_sum", labels) == 100
+        assert get_sample(text, "blog_drf_response_size_bytes_count", labels) == 1
+        assert get_sample(text, "blog_drf_db_queries_total", labels) == 5
+
+    def test_record_from_threads(self):
+        recorded = Metrics()
+
+        def record():
+            for _ in range(1000):
+                recorded.record(("view", "GET", "200"), 0.001, 10, 0, 1)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        text = render(recorded.snapshot())
+        labels = 'view="view",method="GET",status="200"'
+        assert (
+            get_sample(text, "blog_drf_request_duration_seconds_count", labels) == 4000
+        )
+        assert get_sample(text, "blog_drf_db_queries_total", labels) == 4000
+
+    def test_escape_labels(self):
+        recorded = Metrics()
+        recorded.record(('a"b\\c\nd', "GET", "200"), 0.001, 0, 0, 0)
+
+        assert r'view="a\"b\\c\nd"' in render(recorded.snapshot())
+
+    def test_collect_from_processes(self, settings, tmp_path):
+        settings.METRICS_DIR = str(tmp_path)
+        recorded = Metrics()
+        recorded.record(("view", "GET", "200"), 0.001, 10, 0.0005, 1)
+        other = [0] * len(recorded.snapshot()[("view", "GET", "200")])
+        other[0] = 2
+        (tmp_path / "1.json").write_text(json.dumps([["view", "GET", "200", other]]))
+        (tmp_path / ".2.tmp").write_text("[")
+
+        collected = recorded.collect()
+
+        assert collected[("view", "GET", "200")][0] == 3
+        assert (tmp_path / f"{os.getpid()}.json").exists()
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def setup_method(self):
+        self.client = APIClient()
+
+    @pytest.fixture
+    def token(self, settings):
+        settings.METRICS_TOKEN = "secret"
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer secret")
+
+    @pytest.mark.usefixtures("token")
+    def test_requests_recorded(self):
+        PostFactory()
+        before = render(metrics.snapshot())
+
+        self.client.get("/posts/?page=1")
+        response = self.client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        text = response.content.decode()
+        for name, change in (
+            ("blog_drf_request_duration_seconds_count", 1),
+            ("blog_drf_db_queries_total", 2),
+        ):
+            assert get_sample(text, name, LIST_LABELS) == (
+                get_sample(before, name, LIST_LABELS) + change
+            )
+        assert get_sample(text, "blog_drf_response_size_bytes_sum", LIST_LABELS) > (
+            get_sample(before, "blog_drf_response_size_bytes_sum", LIST_LABELS)
+        )
+        assert get_sample(text, "blog_drf_db_duration_seconds_total", LIST_LABELS) > (
+            get_sample(before, "blog_drf_db_duration_seconds_total", LIST_LABELS)
+        )
+
+    def test_token(self, settings):
+        settings.METRICS_TOKEN = "secret"
+
+        assert self.client.get("/metrics").status_code == 403
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer wrong")
+        assert self.client.get("/metrics").status_code == 403
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer secret")
+        assert self.client.get("/metrics").status_code == 200
+
+    def test_without_token_only_in_debug(self, settings):
+        settings.METRICS_TOKEN = ""
+
+        assert self.client.get("/metrics").status_code == 403
+        settings.DEBUG = True
+        assert self.client.get("/metrics").status_code == 200
+
+    @pytest.mark.usefixtures("token")
+    def test_unknown_methods_recorded_as_other(self):
+        labels = (
+            'view="posts.views.post_viewset.PostViewSet.other",'
+            'method="OTHER",status="403"'
+        )
+        name = "blog_drf_request_duration_seconds_count"
+        before = render(metrics.snapshot())
+
+        self.client.generic("MADEUP", "/posts/")
+        self.client.generic("MADEUP2", "/posts/")
+        text = self.client.get("/metrics").content.decode()
+
+        assert "MADEUP" not in text
+        assert get_sample(text, name, labels) == get_sample(before, name, labels) + 2
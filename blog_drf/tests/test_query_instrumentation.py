@@ -0,0 +1,74 @@
+import logging
+
+import pytest
+from rest_framework.test import APIClient
+
+from blog_drf.db.instrumentation import QueryBudgetExceeded, recording_queries
+from posts.models import Post
+from posts.tests.factories import PostFactory
+from posts.views import PostViewSet
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentation:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_recording_counts_duplicates(self):
+        PostFactory.create_batch(3)
+
+        with recording_queries() as outer:
+            with recording_queries() as stats:
+                for post in Post.objects.all():
+                    post.owner  # noqa: B018
+            Post.objects.count()
+
+        assert (stats.count, stats.duplicates) == (4, 2)
+        [(sql, count)] = stats.get_duplicated()
+        assert count == 3 and "auth_user" in sql
+        assert stats.duration > 0
+        assert outer.count == 5
+
+    def test_headers(self, settings):
+        settings.QUERY_STATS_HEADERS = True
+        PostFactory()
+
+        response = self.client.get("/posts/?page=1")
+
+        assert response["X-DB-Query-Count"] == "2"
+        assert response["X-DB-Duplicate-Queries"] == "0"
+        assert float(response["X-DB-Query-Time"]) > 0
+
+    def test_logs_without_headers(self, settings, caplog):
+        settings.QUERY_STATS_HEADERS = False
+        PostFactory()
+
+        with caplog.at_level(logging.INFO, logger="blog_drf.queries"):
+            response = self.client.get("/posts/?page=1")
+
+        assert "X-DB-Query-Count" not in response
+        [record] = caplog.records
+        assert record.view == "posts.views.post_viewset.PostViewSet.list"
+        assert (record.status, record.query_count) == (200, 2)
+
+    def test_over_budget_logged(self, caplog, monkeypatch):
+        PostFactory()
+        monkeypatch.setattr(PostViewSet, "query_budget", {"list": 1})
+
+        with caplog.at_level(logging.WARNING, logger="blog_drf.queries"):
+            response = self.client.get("/posts/?page=1")
+
+        assert response.status_code == 200
+        [record] = caplog.records
+        assert "over its budget of 1" in record.getMessage()
+
+    def test_over_budget_error(self, settings, monkeypatch):
+        PostFactory()
+        settings.QUERY_BUDGETS_RAISE = True
+        monkeypatch.setattr(PostViewSet, "query_budget", {"list": 1})
+
+        with pytest.raises(QueryBudgetExceeded):
+            self.client.get("/posts/?page=1")
+
+        monkeypatch.setattr(PostViewSet, "query_budget", {"retrieve": 1})
+        assert self.client.get("/posts/?page=1").status_code == 200
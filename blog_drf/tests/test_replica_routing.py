@@ -0,0 +1,146 @@
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from blog_drf.db.routers import PrimaryReplicaRouter, read_database
+from blog_drf.middleware import ReplicaRoutingMiddleware
+from posts.models import Post
+from posts.tests.factories import PostFactory
+
+
+@pytest.fixture
+def replicas(monkeypatch, settings):
+    # A replica on the test database, and one that can't be connected to.
+    replica = {**connections.settings["default"], "TEST": {"MIRROR": "default"}}
+    down = {**replica, "PORT": "1", "OPTIONS": {"connect_timeout": 1}}
+    monkeypatch.setitem(connections.settings, "replica", replica)
+    monkeypatch.setitem(connections.settings, "down", down)
+    settings.DATABASE_REPLICAS = ["replica"]
+    yield settings
+    for alias in ("replica", "down"):
+        connections[alias].close()
+        del connections[alias]
+
+
+class TestReplicaRoutingMiddleware:
+    def setup_method(self):
+        self.factory = RequestFactory()
+        self.databases = []
+
+    def get_response(self, request):
+        self.databases.append(PrimaryReplicaRouter().db_for_read(Post))
+        return HttpResponse(status=400 if request.GET.get("invalid") else 200)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_safe_request_reads_from_replica(self, replicas):
+        middleware = ReplicaRoutingMiddleware(self.get_response)
+
+        middleware(self.factory.get("/posts/"))
+        middleware(self.factory.head("/posts/"))
+
+        assert self.databases == ["replica", "replica"]
+        assert read_database.get() is None
+
+    @pytest.mark.django_db(transaction=True)
+    def test_safe_request_without_reads_connects_to_no_replica(self, replicas):
+        middleware = ReplicaRoutingMiddleware(lambda request: HttpResponse())
+
+        middleware(self.factory.get("/metrics"))
+
+        assert connections["replica"].connection is None
+
+    @pytest.mark.django_db(transaction=True)
+    def test_unsafe_request_reads_from_primary(self, replicas):
+        response = ReplicaRoutingMiddleware(self.get_response)(
+            self.factory.post("/posts/")
+        )
+
+        assert self.databases == [None]
+        assert response.cookies["read_primary"]["max-age"] == 10
+
+    @pytest.mark.django_db(transaction=True)
+    def test_failed_unsafe_request_sets_no_cookie(self, replicas):
+        response = ReplicaRoutingMiddleware(self.get_response)(
+            self.factory.post("/posts/?invalid=1")
+        )
+
+        assert "read_primary" not in response.cookies
+
+    @pytest.mark.django_db(transaction=True)
+    def test_reads_after_write_from_primary(self, replicas):
+        request = self.factory.get("/posts/")
+        request.COOKIES["read_primary"] = "1"
+
+        ReplicaRoutingMiddleware(self.get_response)(request)
+
+        assert self.databases == [None]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_unavailable_replica_falls_back(self, replicas, monkeypatch):
+        replicas.DATABASE_REPLICAS = ["down", "replica"]
+        # Always try the replicas in order, so the broken one comes first.
+        monkeypatch.setattr(
+            "blog_drf.middleware.random.sample",
+            lambda population, k: list(population),
+        )
+        middleware = ReplicaRoutingMiddleware(self.get_response)
+
+        for _ in range(3):
+            middleware(self.factory.get("/posts/"))
+
+        assert self.databases == ["replica"] * 3
+        assert list(middleware.replicas_down_until) == ["down"]
+
+        replicas.DATABASE_REPLICAS = ["down"]
+        middleware(self.factory.get("/posts/"))
+
+        assert self.databases[-1] is None
+
+    @pytest.mark.django_db
+    def test_reads_in_transaction_from_primary(self, replicas):
+        # Test cases run in a transaction the replica can't see.
+        ReplicaRoutingMiddleware(self.get_response)(self.factory.get("/posts/"))
+
+        assert self.databases == [None]
+
+    def test_no_replicas(self):
+        response = ReplicaRoutingMiddleware(self.get_response)(
+            self.factory.post("/posts/")
+        )
+
+        assert self.databases == [None]
+        assert "read_primary" not in response.cookies
+
+
+class TestPrimaryReplicaRouter:
+    def setup_method(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_routes_reads_to_read_database(self):
+        token = read_database.set("replica")
+        try:
+            assert self.router.db_for_read(Post) == "replica"
+            assert self.router.db_for_write(Post) == DEFAULT_DB_ALIAS
+        finally:
+            read_database.reset(token)
+
+        assert self.router.db_for_read(Post) is None
+
+    def test_migrates_primary_only(self):
+        assert self.router.allow_migrate(DEFAULT_DB_ALIAS, "posts")
+        assert not self.router.allow_migrate("replica", "posts")
+
+    @pytest.mark.django_db(transaction=True)
+    def test_read_from_replica(self, replicas):
+        PostFactory()
+        token = read_database.set("replica")
+        try:
+            post = Post.objects.get()
+            assert post._state.db == "replica"
+            post.title = "written"
+            post.save()
+        finally:
+            read_database.reset(token)
+
+        assert Post.objects.using(DEFAULT_DB_ALIAS).get().title == "written"
@@ -17,7 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from blog_drf.views import DatabasePoolsAPIView, MetricsView
+
 urlpatterns = [
     path("", include("posts.urls")),
     path("admin/", admin.site.urls),
+    path("db-pools/", DatabasePoolsAPIView.as_view()),
+    path("metrics", MetricsView.as_view()),
 ]
@@ -0,0 +1,57 @@
+import hmac
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.views import View
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from blog_drf.metrics import metrics, render
+
+
+class DatabasePoolsAPIView(APIView):
+    """
+    Connection pool statistics of this process, per database: clients
+    waiting for a connection, time spent waiting for one, pool size and
+    connection errors. Counters are cumulative since the pool was opened.
+    """
+
+    permission_classes = (IsAdminUser,)
+    query_budget = 2
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        pools = {}
+        for alias in connections:
+            get_stats = getattr(connections[alias], "get_pool_stats", None)
+            stats = get_stats() if get_stats is not None else None
+            if stats is not None:
+                pools[alias] = stats
+        return Response(pools)
+
+
+class MetricsView(View):
+    """
+    Request metrics in the Prometheus text format: of every worker process
+    if METRICS_DIR is set, or else of the process serving the scrape.
+    Scrapers must send METRICS_TOKEN as a bearer token; without one, the
+    metrics are only served under DEBUG.
+    """
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        token = settings.METRICS_TOKEN
+        # Without a token, only local development may scrape.
+        allowed = (
+            hmac.compare_digest(
+                request.headers.get("Authorization", ""), f"Bearer {token}"
+            )
+            if token
+            else settings.DEBUG
+        )
+        if not allowed:
+            return HttpResponseForbidden()
+        return HttpResponse(render(metrics.collect()), content_type=self.content_type)
@@ -1,5 +1,6 @@
 from django.contrib import admin
 
+from posts.filters import PostFilterBackend
 from posts.models import Category, Post
 
 
@@ -8,12 +9,23 @@ class PostAdmin(admin.ModelAdmin):
     list_display_links = ("id", "title")
     search_fields = ("title", "content")
 
+    def get_search_results(self, request, queryset, search_term):
+        # Match against the indexed search vector instead of ILIKE over
+        # `search_fields`, which scans the whole table.
+        if not search_term:
+            return queryset, False
+        return PostFilterBackend().search(queryset, search_term), False
+
 
 class CategoryAdmin(admin.ModelAdmin):
-    list_display = ("tag", "name")
+    list_display = ("tag", "name", "post_count")
     list_display_links = ("tag", "name")
     search_fields = ("tag", "name")
 
+    def get_readonly_fields(self, request, obj=None):
+        # Another tag would save a copy of the category, not rename it.
+        return ("tag",) if obj else ()
+
     class Meta:
         plural = "Categories"
 
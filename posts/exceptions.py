@@ -0,0 +1,18 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = _("The resource has been modified since it was read.")
+    default_code = "precondition_failed"
+
+
+class UnknownOwnersError(Exception):
+    def __init__(self, owners: dict[int, str]):
+        self.owners = owners
+        super().__init__(
+            "Unknown owners: "
+            + ", ".join(f"{name!r} (line {line})" for line, name in owners.items())
+        )
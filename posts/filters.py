@@ -0,0 +1,54 @@
+import operator
+from functools import reduce
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import Exists, F, OuterRef, Q
+from rest_framework.filters import BaseFilterBackend
+
+from posts.models import Post
+from posts.serializers import PostFilterSerializer
+
+
+class PostFilterBackend(BaseFilterBackend):
+    search_config = "english"
+
+    def filter_queryset(self, request, queryset, view):
+        serializer = PostFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        if "owner" in params:
+            queryset = queryset.filter(owner_id=params["owner"])
+        if params.get("category"):
+            queryset = queryset.filter(self.in_categories(params["category"]))
+        if "created_after" in params:
+            queryset = queryset.filter(created_at__gte=params["created_after"])
+        if "created_before" in params:
+            queryset = queryset.filter(created_at__lt=params["created_before"])
+        if "updated_since" in params:
+            queryset = queryset.filter(updated_at__gte=params["updated_since"])
+        if params.get("search"):
+            queryset = self.search(queryset, params["search"])
+        return queryset
+
+    def in_categories(self, tags: list[str]) -> Q:
+        # Semi-joins rather than a join, so posts in several of the requested
+        # categories aren't duplicated and need no DISTINCT. One EXISTS per
+        # tag lets each probe the (category_id, post_id) index, which a
+        # single `category_id IN (...)` subquery can't use in id order.
+        memberships = Post.categories.through.objects.filter(post_id=OuterRef("pk"))
+        return reduce(
+            operator.or_,
+            (
+                Q(Exists(memberships.filter(category_id=tag)))
+                for tag in dict.fromkeys(tags)
+            ),
+        )
+
+    def search(self, queryset, text):
+        query = SearchQuery(text, config=self.search_config, search_type="websearch")
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "id")
+        )
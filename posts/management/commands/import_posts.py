@@ -0,0 +1,145 @@
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import nullcontext
+from itertools import islice
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from posts.exceptions import UnknownOwnersError
+from posts.models import Category, Post
+from posts.services import PostsImportService
+from posts.services.posts_import_service import ImportRow
+
+
+class Command(BaseCommand):
+    help = (
+        "Import posts from NDJSON or CSV. Each record has `title`, `owner` "
+        "(a username) and optionally `content`, `categories` (a list, or "
+        "`;`-separated tags in CSV), `created_at` and `updated_at`. The "
+        "import is all or nothing."
+    )
+    import_service = PostsImportService()
+    formats = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+    title_max_length = Post._meta.get_field("title").max_length
+    tag_max_length = Category._meta.get_field("tag").max_length
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for standard input.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(set(self.formats.values())),
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument("--batch-size", type=int, default=50_000)
+
+    def handle(self, *args, path: str, format: str | None, batch_size: int, **options):
+        format = format or self.formats.get(Path(path).suffix.lower())
+        if format is None:
+            raise CommandError("Cannot infer the format, pass --format.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        started = time.perf_counter()
+        imported = 0
+        with self.__open(path) as file, transaction.atomic():
+            self.import_service.prepare()
+            rows = self.__read(file, format)
+            while batch := list(islice(rows, batch_size)):
+                try:
+                    imported += self.import_service.import_batch(batch)
+                except UnknownOwnersError as exc:
+                    raise CommandError(str(exc)) from exc
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"{imported} posts staged")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} posts in {elapsed:.2f}s "
+                f"({imported / elapsed:.0f} rows/s)."
+            )
+        )
+
+    @staticmethod
+    def __open(path: str):
+        if path == "-":
+            return nullcontext(sys.stdin)
+        try:
+            return open(path, newline="", encoding="utf-8")
+        except OSError as exc:
+            raise CommandError(f"Cannot open {path}: {exc.strerror}.") from exc
+
+    def __read(self, file, format: str) -> Iterator[ImportRow]:
+        if format == "csv":
+            reader = csv.DictReader(file)
+            records = ((reader.line_num, record) for record in reader)
+        else:
+            records = (
+                (line, self.__parse_json(line, text))
+                for line, text in enumerate(file, start=1)
+                if text.strip()
+            )
+        for line, record in records:
+            yield self.__to_row(line, record)
+
+    @staticmethod
+    def __parse_json(line: int, text: str) -> dict:
+        try:
+            record = json.loads(text)
+        except ValueError as exc:
+            raise CommandError(f"Line {line}: invalid JSON: {exc}.") from exc
+        if not isinstance(record, dict):
+            raise CommandError(f"Line {line}: expected a JSON object.")
+        return record
+
+    def __to_row(self, line: int, record: dict) -> ImportRow:
+        title = record.get("title") or ""
+        owner = record.get("owner") or ""
+        categories = record.get("categories") or []
+        if isinstance(categories, str):
+            categories = categories.split(";")
+        if not all(isinstance(tag, str) for tag in categories):
+            raise CommandError(f"Line {line}: `categories` must be tags.")
+        tags = [tag.strip() for tag in categories if tag.strip()]
+
+        if not title or len(title) > self.title_max_length:
+            raise CommandError(
+                f"Line {line}: `title` must have 1 to "
+                f"{self.title_max_length} characters."
+            )
+        if not owner:
+            raise CommandError(f"Line {line}: `owner` is required.")
+        if any(len(tag) > self.tag_max_length for tag in tags):
+            raise CommandError(
+                f"Line {line}: tags must have at most "
+                f"{self.tag_max_length} characters."
+            )
+        return (
+            line,
+            title,
+            record.get("content") or "",
+            str(owner),
+            tags,
+            self.__datetime(line, record, "created_at"),
+            self.__datetime(line, record, "updated_at"),
+        )
+
+    @staticmethod
+    def __datetime(line: int, record: dict, field: str):
+        if not record.get(field):
+            return None
+        try:
+            value = parse_datetime(record[field])
+        except (TypeError, ValueError):
+            value = None
+        if value is None or value.tzinfo is None:
+            raise CommandError(
+                f"Line {line}: `{field}` must be an ISO 8601 datetime with an offset."
+            )
+        return value
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from posts.services import PostCountersService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the post counters of categories and users, and repair those "
+        "that have drifted. Each batch commits on its own."
+    )
+    counters_service = PostCountersService()
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, batch_size: int, **options):
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        for name, recount, start in (
+            ("categories", self.counters_service.recount_categories, ""),
+            ("users", self.counters_service.recount_users, 0),
+        ):
+            repaired = 0
+            after = start
+            while after is not None:
+                with transaction.atomic():
+                    after, batch_repaired = recount(after, batch_size)
+                repaired += batch_repaired
+                if options["verbosity"] > 1 and after is not None:
+                    self.stdout.write(f"{name}: recounted up to {after!r}")
+            self.stdout.write(self.style.SUCCESS(f"Repaired {repaired} {name}."))
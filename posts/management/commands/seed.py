@@ -0,0 +1,102 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from posts.services import SeedService
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed users, profiles, categories, posts and their categories, the "
+        "same rows for the same --seed. A few users and categories get most "
+        "of the posts; --users 0 spreads posts over the existing users. Each "
+        "batch commits on its own."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument("--posts", type=int, default=100_000)
+        parser.add_argument("--categories", type=int, default=500)
+        parser.add_argument(
+            "--profiles", type=float, default=0.5, help="Share of users with a profile."
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of posts per user and per category.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--password", default="seed", help="The password of every user."
+        )
+        parser.add_argument("--batch-size", type=int, default=50_000)
+
+    def handle(
+        self,
+        *args,
+        users: int,
+        posts: int,
+        categories: int,
+        profiles: float,
+        skew: float,
+        seed: int,
+        password: str,
+        batch_size: int,
+        **options,
+    ):
+        if min(users, posts, categories) < 0:
+            raise CommandError("--users, --posts and --categories can't be negative.")
+        if not 0 <= profiles <= 1:
+            raise CommandError("--profiles must be between 0 and 1.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        started = time.perf_counter()
+        seed_service = SeedService(seed=seed, skew=skew, password=password)
+        verbose = options["verbosity"] > 1
+
+        user_ids = self.__seed_users(seed_service, users, profiles, batch_size, verbose)
+        if posts and not user_ids:
+            raise CommandError("Posts need users, seed some with --users.")
+
+        with transaction.atomic():
+            tags = seed_service.create_categories(categories)
+
+        seeded_posts = 0
+        if posts:
+            seed_service.prepare_posts()
+        for size in self.__batches(posts, batch_size):
+            with transaction.atomic():
+                seeded_posts += len(seed_service.create_posts(size, user_ids, tags))
+            if verbose:
+                self.stdout.write(f"{seeded_posts} posts")
+
+        seed_service.analyze()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {users} users, {categories} categories and "
+                f"{seeded_posts} posts in {elapsed:.2f}s."
+            )
+        )
+
+    def __seed_users(
+        self, seed_service, users: int, profiles: float, batch_size: int, verbose
+    ) -> list[int]:
+        user_ids = []
+        for size in self.__batches(users, batch_size):
+            with transaction.atomic():
+                user_ids.extend(seed_service.create_users(size, profiles))
+            if verbose:
+                self.stdout.write(f"{len(user_ids)} users")
+        return user_ids or list(
+            User.objects.order_by("id").values_list("id", flat=True)
+        )
+
+    @staticmethod
+    def __batches(total: int, batch_size: int):
+        for start in range(0, total, batch_size):
+            yield min(batch_size, total - start)
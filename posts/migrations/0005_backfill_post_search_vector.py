@@ -0,0 +1,31 @@
+# Generated by Django 4.2.5 on 2026-10-18 07:25
+
+from django.db import migrations
+
+BATCH_SIZE = 5000
+
+
+def backfill_search_vector(apps, schema_editor):
+    # Every batch commits on its own, so rows are only locked for one batch.
+    # Assigning title to itself is enough to fire the search vector trigger.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT coalesce(max(id), 0) FROM posts_post")
+        (max_id,) = cursor.fetchone()
+        for start in range(0, max_id, BATCH_SIZE):
+            cursor.execute(
+                "UPDATE posts_post SET title = title "
+                "WHERE id > %s AND id <= %s AND search_vector IS NULL",
+                [start, start + BATCH_SIZE],
+            )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("posts", "0004_post_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
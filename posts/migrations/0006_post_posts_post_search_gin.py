@@ -0,0 +1,23 @@
+# Generated by Django 4.2.5 on 2026-10-18 07:25
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("posts", "0005_backfill_post_search_vector"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"],
+                name="posts_post_search_gin",
+            ),
+        ),
+    ]
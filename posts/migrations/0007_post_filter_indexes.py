@@ -0,0 +1,42 @@
+# Generated by Django 4.2.5 on 2026-10-18 07:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("posts", "0006_post_posts_post_search_gin"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(fields=["owner", "id"], name="posts_post_owner_id_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["created_at", "id"],
+                name="posts_post_created_id_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["updated_at", "id"],
+                name="posts_post_updated_id_idx",
+            ),
+        ),
+        # The auto-created through table only has (post_id, category_id) and
+        # (category_id); filtering posts by category needs both columns.
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "posts_post_categories_category_post_idx "
+            "ON posts_post_categories (category_id, post_id)",
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "posts_post_categories_category_post_idx",
+        ),
+    ]
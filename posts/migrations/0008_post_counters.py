@@ -0,0 +1,141 @@
+# Generated by Django 4.2.5 on 2026-10-18 08:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Statement-level triggers, so bulk inserts and deletes (including the
+# import's INSERT ... SELECT) update each counter once per statement.
+POST_COUNT_TRIGGERS = """
+CREATE FUNCTION posts_userstats_post_count_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO posts_userstats (owner_id, post_count)
+        SELECT owner_id, count(*) FROM new_posts GROUP BY owner_id
+        ON CONFLICT (owner_id) DO UPDATE
+            SET post_count = posts_userstats.post_count + EXCLUDED.post_count;
+    ELSE
+        UPDATE posts_userstats s SET post_count = s.post_count - d.n
+        FROM (SELECT owner_id, count(*) AS n FROM old_posts GROUP BY owner_id) d
+        WHERE s.owner_id = d.owner_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_post_count_insert_trigger
+    AFTER INSERT ON posts_post REFERENCING NEW TABLE AS new_posts
+    FOR EACH STATEMENT EXECUTE FUNCTION posts_userstats_post_count_update();
+
+CREATE TRIGGER posts_post_count_delete_trigger
+    AFTER DELETE ON posts_post REFERENCING OLD TABLE AS old_posts
+    FOR EACH STATEMENT EXECUTE FUNCTION posts_userstats_post_count_update();
+
+CREATE FUNCTION posts_userstats_post_owner_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE posts_userstats SET post_count = post_count - 1
+    WHERE owner_id = OLD.owner_id;
+    INSERT INTO posts_userstats (owner_id, post_count) VALUES (NEW.owner_id, 1)
+    ON CONFLICT (owner_id) DO UPDATE
+        SET post_count = posts_userstats.post_count + 1;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_post_count_owner_trigger
+    AFTER UPDATE OF owner_id ON posts_post
+    FOR EACH ROW WHEN (OLD.owner_id IS DISTINCT FROM NEW.owner_id)
+    EXECUTE FUNCTION posts_userstats_post_owner_update();
+
+CREATE FUNCTION posts_category_post_count_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE posts_category c SET post_count = c.post_count + d.n
+        FROM (
+            SELECT category_id, count(*) AS n FROM new_memberships
+            GROUP BY category_id
+        ) d
+        WHERE c.tag = d.category_id;
+    ELSE
+        UPDATE posts_category c SET post_count = c.post_count - d.n
+        FROM (
+            SELECT category_id, count(*) AS n FROM old_memberships
+            GROUP BY category_id
+        ) d
+        WHERE c.tag = d.category_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_post_categories_count_insert_trigger
+    AFTER INSERT ON posts_post_categories REFERENCING NEW TABLE AS new_memberships
+    FOR EACH STATEMENT EXECUTE FUNCTION posts_category_post_count_update();
+
+CREATE TRIGGER posts_post_categories_count_delete_trigger
+    AFTER DELETE ON posts_post_categories REFERENCING OLD TABLE AS old_memberships
+    FOR EACH STATEMENT EXECUTE FUNCTION posts_category_post_count_update();
+"""
+
+DROP_POST_COUNT_TRIGGERS = """
+DROP TRIGGER IF EXISTS posts_post_categories_count_delete_trigger
+    ON posts_post_categories;
+DROP TRIGGER IF EXISTS posts_post_categories_count_insert_trigger
+    ON posts_post_categories;
+DROP FUNCTION IF EXISTS posts_category_post_count_update();
+DROP TRIGGER IF EXISTS posts_post_count_owner_trigger ON posts_post;
+DROP FUNCTION IF EXISTS posts_userstats_post_owner_update();
+DROP TRIGGER IF EXISTS posts_post_count_delete_trigger ON posts_post;
+DROP TRIGGER IF EXISTS posts_post_count_insert_trigger ON posts_post;
+DROP FUNCTION IF EXISTS posts_userstats_post_count_update();
+"""
+
+# In the same transaction as the triggers, which lock out writes until it
+# commits, so no post is counted twice or missed.
+BACKFILL_POST_COUNTS = """
+UPDATE posts_category c SET post_count = d.n
+FROM (
+    SELECT category_id, count(*) AS n FROM posts_post_categories
+    GROUP BY category_id
+) d
+WHERE c.tag = d.category_id;
+
+INSERT INTO posts_userstats (owner_id, post_count)
+SELECT owner_id, count(*) FROM posts_post GROUP BY owner_id;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("posts", "0007_post_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserStats",
+            fields=[
+                (
+                    "owner",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("post_count", models.IntegerField(default=0, editable=False)),
+            ],
+            options={
+                "verbose_name_plural": "User stats",
+            },
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="post_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(POST_COUNT_TRIGGERS, DROP_POST_COUNT_TRIGGERS),
+        migrations.RunSQL(BACKFILL_POST_COUNTS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 4.2.5 on 2026-10-18 08:38
+
+from django.db import migrations, models, transaction
+
+# Frozen here as posts.models.post.EXCERPT_LENGTH was when this migration
+# was written: changing the length takes a new migration that replaces the
+# function and the column, and backfills the excerpts again.
+EXCERPT_LENGTH = 200
+# Only this much of the start of the content is read, however large it is.
+EXCERPT_SCAN_LENGTH = 4 * EXCERPT_LENGTH
+
+# The content with whitespace collapsed, cut to EXCERPT_LENGTH characters.
+EXCERPT_TRIGGER = rf"""
+CREATE FUNCTION posts_post_excerpt(content text) RETURNS text AS $$
+    SELECT rtrim(left(
+        regexp_replace(
+            left(regexp_replace(content, '^\s+', ''), {EXCERPT_SCAN_LENGTH}),
+            '\s+', ' ', 'g'
+        ),
+        {EXCERPT_LENGTH}
+    ))
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE FUNCTION posts_post_excerpt_update() RETURNS trigger AS $$
+BEGIN
+    NEW.excerpt := posts_post_excerpt(coalesce(NEW.content, ''));
+    NEW.content_length := char_length(coalesce(NEW.content, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_post_excerpt_trigger
+    BEFORE INSERT OR UPDATE OF content ON posts_post
+    FOR EACH ROW EXECUTE FUNCTION posts_post_excerpt_update();
+"""
+
+DROP_EXCERPT_TRIGGER = """
+DROP TRIGGER IF EXISTS posts_post_excerpt_trigger ON posts_post;
+DROP FUNCTION IF EXISTS posts_post_excerpt_update();
+DROP FUNCTION IF EXISTS posts_post_excerpt(text);
+"""
+
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def backfill_excerpts(apps, schema_editor):
+    # Batches commit on their own, so rows are only locked briefly. Posts
+    # written meanwhile already get theirs from the trigger.
+    connection = schema_editor.connection
+    after = 0
+    while after is not None:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE posts_post p SET
+                    excerpt = posts_post_excerpt(p.content),
+                    content_length = char_length(p.content)
+                FROM (
+                    SELECT id FROM posts_post WHERE id > %s ORDER BY id LIMIT %s
+                ) batch
+                WHERE p.id = batch.id
+                RETURNING p.id
+                """,
+                [after, BACKFILL_BATCH_SIZE],
+            )
+            after = max((id for (id,) in cursor.fetchall()), default=None)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("posts", "0008_post_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="content_length",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="excerpt",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=EXCERPT_LENGTH
+            ),
+        ),
+        migrations.RunSQL(EXCERPT_TRIGGER, DROP_EXCERPT_TRIGGER),
+        migrations.RunPython(backfill_excerpts, migrations.RunPython.noop),
+    ]
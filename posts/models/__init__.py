@@ -1,3 +1,4 @@
 from .category import Category
 from .post import Post
 from .profile import Profile
+from .user_stats import UserStats
@@ -4,7 +4,14 @@ from django.db import models
 class Category(models.Model):
     tag = models.CharField(max_length=10, primary_key=True)
     name = models.CharField(max_length=100)
+    # Maintained by database triggers on the posts' categories.
+    post_count = models.IntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name_plural = "Categories"
         ordering = ["tag"]
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced):
+        # The loaded count may be stale by now, so never write it back.
+        values = [value for value in values if value[0].name != "post_count"]
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced)
@@ -1,16 +1,46 @@
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from .category import Category
 
+# The database cuts excerpts to this length, see migration 0009: changing it
+# takes a new migration.
+EXCERPT_LENGTH = 200
+
+
+class PostManager(models.Manager):
+    def get_queryset(self):
+        # The search vector is maintained by a database trigger and is only
+        # ever read by search queries, so don't drag it into every row.
+        return super().get_queryset().defer("search_vector")
+
 
 class Post(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField(blank=True)
+    # Maintained by a database trigger from the content, so lists can leave
+    # the content, which may be large and stored out of line, unread.
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH, blank=True, default="", editable=False
+    )
+    content_length = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     categories = models.ManyToManyField(Category, blank=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="posts")
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = PostManager()
 
     class Meta:
         ordering = ["id"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="posts_post_search_gin"),
+            # Keyset pages of the filtered lists: `WHERE x = .. AND id > ..`
+            # or `WHERE x > .. ORDER BY x, id`.
+            models.Index(fields=["owner", "id"], name="posts_post_owner_id_idx"),
+            models.Index(fields=["created_at", "id"], name="posts_post_created_id_idx"),
+            models.Index(fields=["updated_at", "id"], name="posts_post_updated_id_idx"),
+        ]
@@ -0,0 +1,16 @@
+from django.contrib.auth.models import User
+from django.db import models
+
+
+class UserStats(models.Model):
+    # Rows are created and maintained by database triggers on posts.
+    owner = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    post_count = models.IntegerField(default=0, editable=False)
+
+    class Meta:
+        verbose_name_plural = "User stats"
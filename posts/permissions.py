@@ -12,7 +12,8 @@ class IsOwnerOrReadOnly(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        return obj.owner == request.user
+        # Without loading the owner.
+        return obj.owner_id == request.user.id
 
 
 class DoesUserAffectHisObject(BasePermission):
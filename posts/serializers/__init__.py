@@ -1,4 +1,15 @@
 from .category_serializer import CategorySerializer
+from .post_bulk_serializers import (
+    BULK_MAX_ITEMS,
+    PostBulkDeleteSerializer,
+    PostBulkUpdateItemSerializer,
+)
+from .post_filter_serializer import PostFilterSerializer
 from .post_serializer import PostSerializer
-from .profile_serializer import DetailedProfileSerializer, ProfileSerializer
+from .profile_serializer import (
+    DetailedProfileSerializer,
+    DetailedProfileWriteSerializer,
+    ProfileSerializer,
+)
 from .user_serializer import UserSerializer
+from .values_serializer import ValuesSerializer
@@ -7,3 +7,9 @@ class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = "__all__"
+
+    def update(self, instance, validated_data):
+        if validated_data.get("tag", instance.tag) != instance.tag:
+            # Another tag makes another category, which has no posts yet.
+            instance.post_count = 0
+        return super().update(instance, validated_data)
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+BULK_MAX_ITEMS = 1000
+
+
+class PostBulkUpdateItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField(min_value=1)
+
+
+class PostBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=BULK_MAX_ITEMS,
+    )
@@ -0,0 +1,32 @@
+from rest_framework import serializers
+
+from posts.models import Category
+
+TAG_MAX_LENGTH = Category._meta.get_field("tag").max_length
+
+
+class PostFilterSerializer(serializers.Serializer):
+    owner = serializers.IntegerField(required=False, min_value=1)
+    search = serializers.CharField(required=False, max_length=200)
+    category = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        max_length=50,
+    )
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    updated_since = serializers.DateTimeField(required=False)
+
+    def validate_category(self, value: list[str]) -> list[str]:
+        # Accept both `?category=a&category=b` and `?category=a,b`.
+        tags = [tag for item in value for tag in item.split(",") if tag]
+        if len(tags) > self.fields["category"].max_length:
+            raise serializers.ValidationError(
+                f"Ensure this field has no more than "
+                f"{self.fields['category'].max_length} elements."
+            )
+        if any(len(tag) > TAG_MAX_LENGTH for tag in tags):
+            raise serializers.ValidationError(
+                f"Ensure each tag has no more than {TAG_MAX_LENGTH} characters."
+            )
+        return tags
@@ -1,13 +1,44 @@
+from django.db import transaction
 from rest_framework import serializers
 
 from posts.models import Post
+from posts.serializers.related_fields import BatchedPrimaryKeyRelatedField
+from posts.services.posts_bulk_service import PostsBulkService
 
 
 class PostSerializer(serializers.ModelSerializer):
+    # All of a post's categories are looked up with one query.
+    serializer_related_field = BatchedPrimaryKeyRelatedField
     owner = serializers.PrimaryKeyRelatedField(
         read_only=True,
     )
+    bulk_service = PostsBulkService()
 
     class Meta:
         model = Post
-        fields = "__all__"
+        exclude = ("search_vector",)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # Sparse fieldsets picked by the view, see SparseFieldsMixin.
+        selected = self.context.get("post_fields")
+        if selected is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in selected}
+
+    # `categories.set()` would read the current categories, and which of the
+    # new ones exist, before writing them.
+    @transaction.atomic(savepoint=False)
+    def create(self, validated_data):
+        categories = validated_data.pop("categories", [])
+        post = super().create(validated_data)
+        self.bulk_service.add_categories([(post, categories)])
+        return post
+
+    @transaction.atomic(savepoint=False)
+    def update(self, instance, validated_data):
+        categories = validated_data.pop("categories", None)
+        post = super().update(instance, validated_data)
+        if categories is not None:
+            self.bulk_service.set_categories(post, categories)
+        return post
@@ -9,6 +9,13 @@ class DetailedProfileSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class DetailedProfileWriteSerializer(DetailedProfileSerializer):
+    # The owner is always the requesting user, so there's nothing to look up
+    # or validate.
+    class Meta(DetailedProfileSerializer.Meta):
+        read_only_fields = ("owner",)
+
+
 class ProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Profile
@@ -0,0 +1,65 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+
+class BatchedManyRelatedField(serializers.ManyRelatedField):
+    """
+    ManyRelatedField that looks all the submitted primary keys up with one
+    query rather than one per key, with the same errors.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+        return self.child_relation.to_internal_values(data)
+
+
+class BatchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    # Stands for keys of the wrong type, which no row can have.
+    __invalid = object()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.__found = {}
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BatchedManyRelatedField(**list_kwargs)
+
+    def to_internal_values(self, data) -> list:
+        if self.pk_field is not None:
+            data = [self.pk_field.to_internal_value(item) for item in data]
+        queryset = self.get_queryset()
+        pks = [self.__to_pk(queryset.model, item) for item in data]
+        # The items of a many=True serializer share this field, so a key is
+        # looked up once for all of them.
+        missing = [
+            pk for pk in pks if pk is not self.__invalid and pk not in self.__found
+        ]
+        if missing:
+            self.__found.update(queryset.in_bulk(missing))
+
+        # Fail on the first bad key, as the per-key lookups would have.
+        values = []
+        for item, pk in zip(data, pks):
+            if pk is self.__invalid:
+                self.fail("incorrect_type", data_type=type(item).__name__)
+            if pk not in self.__found:
+                self.fail("does_not_exist", pk_value=item)
+            values.append(self.__found[pk])
+        return values
+
+    def __to_pk(self, model, item):
+        try:
+            if isinstance(item, bool):
+                raise TypeError
+            return model._meta.pk.to_python(item)
+        except (TypeError, ValueError, DjangoValidationError):
+            return self.__invalid
@@ -6,15 +6,21 @@ from posts.serializers import PostSerializer, ProfileSerializer
 
 class UserSerializer(serializers.ModelSerializer):
     profile = ProfileSerializer(read_only=True)
-    posts = PostSerializer(many=True, read_only=True)
+    posts = PostSerializer(many=True, read_only=True, source="embedded_posts")
+    post_count = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = (
             "profile",
             "posts",
+            "post_count",
             "first_name",
             "last_name",
             "email",
             "date_joined",
         )
+
+    def get_post_count(self, user: User) -> int:
+        # Users get their stats row with their first post.
+        return user.stats.post_count if hasattr(user, "stats") else 0
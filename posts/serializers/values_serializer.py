@@ -0,0 +1,192 @@
+from collections.abc import Callable, Collection, Iterable
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.db.models import OuterRef
+from django.utils.functional import cached_property
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import ManyRelatedField
+from rest_framework.settings import api_settings
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path for the list output of a ModelSerializer: rows come
+    from `.values()` and each field gets a converter picked once per call,
+    instead of a model instance per row and DRF's per-field `get_attribute`
+    and `to_representation`. Many-to-many primary keys are read as arrays
+    in the same query rather than prefetched.
+
+    The output is the same as the serializer's; fields that can't be
+    reproduced exactly are rejected when the fields are first inspected.
+    `select()` narrows it to some of the fields.
+    """
+
+    # Fields whose `to_representation` only looks at the value itself.
+    value_fields = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.ChoiceField,
+        serializers.DateField,
+        serializers.DateTimeField,
+        serializers.DecimalField,
+        serializers.FloatField,
+        serializers.IntegerField,
+        serializers.ReadOnlyField,
+    )
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer]):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        self.pk_column = self.model._meta.pk.attname
+        self.loaded_fields = []
+
+    def select(
+        self, fields: Collection[str], loaded: Collection[str] = ()
+    ) -> "ValuesSerializer":
+        """
+        A copy that only outputs `fields`, and only queries their columns and
+        those of `loaded`, e.g. for pagination.
+        """
+        selected = ValuesSerializer(self.serializer_class)
+        selected.__readable_fields = [
+            field for field in self.__readable_fields if field.field_name in fields
+        ]
+        selected.loaded_fields = [
+            field
+            for field in self.__readable_fields
+            if field.field_name in loaded and field.field_name not in fields
+        ]
+        return selected
+
+    def get_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        fields = self.__readable_fields + self.loaded_fields
+        columns = [
+            field.source for field in fields if not isinstance(field, ManyRelatedField)
+        ]
+        arrays = {
+            self.__get_column(field): self.__get_related_pks(field)
+            for field in fields
+            if isinstance(field, ManyRelatedField)
+        }
+        return queryset.prefetch_related(None).values(*columns, **arrays)
+
+    def to_representation(self, rows: Iterable[dict]) -> list[dict]:
+        plan = [
+            (field.field_name, self.__get_column(field), self.__get_converter(field))
+            for field in self.__readable_fields
+        ]
+
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, convert in plan:
+                value = row[column]
+                if value is not None and convert is not None:
+                    value = convert(value)
+                item[name] = value
+            data.append(item)
+        return data
+
+    @cached_property
+    def __readable_fields(self) -> list[serializers.Field]:
+        fields = [
+            field
+            for field in self.serializer_class().fields.values()
+            if not field.write_only
+        ]
+        for field in fields:
+            if not self.__is_supported(field):
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{field.field_name} can't "
+                    f"be serialized from values."
+                )
+        return fields
+
+    def __is_supported(self, field: serializers.Field) -> bool:
+        if "." in field.source or field.source == "*":
+            return False
+        if isinstance(field, ManyRelatedField):
+            return (
+                isinstance(field.child_relation, serializers.PrimaryKeyRelatedField)
+                and field.child_relation.pk_field is None
+                and self.__has_model_field(field.source, "many_to_many")
+            )
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            # `.values()` reads a foreign key by name as the related pk.
+            return field.pk_field is None and self.__has_model_field(
+                field.source, "many_to_one"
+            )
+        return isinstance(field, self.value_fields) and self.__has_model_field(
+            field.source, "concrete"
+        )
+
+    def __has_model_field(self, name: str, flag: str) -> bool:
+        try:
+            return bool(getattr(self.model._meta.get_field(name), flag))
+        except FieldDoesNotExist:
+            return False
+
+    @staticmethod
+    def __get_column(field: serializers.Field) -> str:
+        if isinstance(field, ManyRelatedField):
+            # Annotations can't shadow the model field itself.
+            return f"{field.source}_pks"
+        return field.source
+
+    def __get_converter(self, field: serializers.Field) -> Callable | None:
+        if isinstance(
+            field,
+            (serializers.ReadOnlyField, serializers.RelatedField, ManyRelatedField),
+        ):
+            return None
+        if type(field).to_representation is serializers.CharField.to_representation:
+            return str
+        if type(field).to_representation is serializers.IntegerField.to_representation:
+            return int
+        if isinstance(field, serializers.DateTimeField):
+            return self.__get_datetime_converter(field)
+        return field.to_representation
+
+    @staticmethod
+    def __get_datetime_converter(field: serializers.DateTimeField) -> Callable:
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is None or output_format.lower() != ISO_8601:
+            return field.to_representation
+        # Looked up per call, as the active timezone may change per request.
+        field_timezone = (
+            field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        )
+        if field_timezone is None:
+            return field.to_representation
+
+        def convert(value):
+            if value.tzinfo is None:
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            return value
+
+        return convert
+
+    def __get_related_pks(self, field: ManyRelatedField) -> ArraySubquery:
+        model_field = self.model._meta.get_field(field.source)
+        related_meta = model_field.related_model._meta
+        if list(related_meta.ordering) in ([related_meta.pk.name], ["pk"]):
+            # Ordered by pk, which the through table's index already has.
+            through = model_field.remote_field.through
+            column = through._meta.get_field(
+                model_field.m2m_reverse_field_name()
+            ).attname
+            related = through._default_manager.filter(
+                **{model_field.m2m_field_name(): OuterRef(self.pk_column)}
+            ).order_by(column)
+            return ArraySubquery(related.values(column))
+
+        # Otherwise in the related model's ordering, as `prefetch_related` is.
+        related = model_field.related_model._default_manager.filter(
+            **{model_field.related_query_name(): OuterRef(self.pk_column)}
+        )
+        return ArraySubquery(related.values("pk"))
@@ -1 +1,6 @@
-from .users_service import UsersService
+from .categories_cache_service import CategoriesCacheService
+from .post_counters_service import PostCountersService
+from .posts_bulk_service import PostsBulkService
+from .posts_import_service import PostsImportService
+from .profiles_service import ProfilesService
+from .seed_service import SeedService
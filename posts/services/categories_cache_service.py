@@ -0,0 +1,41 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+
+
+class CategoriesCacheService:
+    """
+    Rendered category responses keyed by a version of the categories table.
+    Writes bump the version, so stale entries are never read again and simply
+    age out of the cache.
+    """
+
+    version_key = "categories:version"
+    response_timeout = 60 * 60 * 24
+
+    def get_version(self) -> int:
+        version = cache.get(self.version_key)
+        if version is None:
+            # Start from the clock rather than 1, so losing the version key
+            # can't bring back responses rendered for an older version.
+            version = time.time_ns()
+            if not cache.add(self.version_key, version, timeout=None):
+                version = cache.get(self.version_key, version)
+        return version
+
+    def bump_version(self) -> None:
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, time.time_ns(), timeout=None)
+
+    def get_response_key(self, path: str, media_type: str) -> str:
+        digest = hashlib.md5(f"{media_type}:{path}".encode()).hexdigest()
+        return f"categories:{self.get_version()}:{digest}"
+
+    def get_response(self, key: str) -> tuple[bytes, str] | None:
+        return cache.get(key)
+
+    def set_response(self, key: str, content: bytes, content_type: str) -> None:
+        cache.set(key, (content, content_type), timeout=self.response_timeout)
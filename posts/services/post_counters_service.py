@@ -0,0 +1,80 @@
+from django.contrib.auth.models import User
+from django.db import connection
+
+from posts.models import Category, Post, UserStats
+
+
+class PostCountersService:
+    """
+    Recounts the post counters that database triggers maintain, for when
+    they have drifted, e.g. after raw SQL that bypassed the triggers.
+
+    Each call handles one batch and locks its counter rows first, so that
+    concurrent writers wait for it rather than getting counted twice or
+    missed; run each batch in its own short transaction.
+    """
+
+    def recount_categories(self, after: str, limit: int) -> tuple[str | None, int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT tag FROM {Category._meta.db_table}
+                WHERE tag > %s ORDER BY tag LIMIT %s FOR UPDATE
+                """,
+                [after, limit],
+            )
+            tags = [tag for (tag,) in cursor.fetchall()]
+            if not tags:
+                return None, 0
+
+            cursor.execute(
+                f"""
+                UPDATE {Category._meta.db_table} c SET post_count = d.n
+                FROM (
+                    SELECT t.tag, count(m.post_id) AS n
+                    FROM unnest(%s::text[]) AS t(tag)
+                    LEFT JOIN {Post.categories.through._meta.db_table} m
+                        ON m.category_id = t.tag
+                    GROUP BY t.tag
+                ) d
+                WHERE c.tag = d.tag AND c.post_count <> d.n
+                """,
+                [tags],
+            )
+            return tags[-1], cursor.rowcount
+
+    def recount_users(self, after: int, limit: int) -> tuple[int | None, int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT id FROM {User._meta.db_table} "
+                "WHERE id > %s ORDER BY id LIMIT %s",
+                [after, limit],
+            )
+            ids = [id for (id,) in cursor.fetchall()]
+            if not ids:
+                return None, 0
+
+            cursor.execute(
+                f"""
+                SELECT owner_id FROM {UserStats._meta.db_table}
+                WHERE owner_id = ANY(%s) ORDER BY owner_id FOR UPDATE
+                """,
+                [ids],
+            )
+            # Users without posts only need a row if they have a wrong one.
+            cursor.execute(
+                f"""
+                INSERT INTO {UserStats._meta.db_table} AS s (owner_id, post_count)
+                SELECT u.id, count(p.id)
+                FROM unnest(%s::bigint[]) AS u(id)
+                LEFT JOIN {Post._meta.db_table} p ON p.owner_id = u.id
+                GROUP BY u.id
+                HAVING count(p.id) > 0 OR EXISTS (
+                    SELECT FROM {UserStats._meta.db_table} e WHERE e.owner_id = u.id
+                )
+                ON CONFLICT (owner_id) DO UPDATE SET post_count = EXCLUDED.post_count
+                WHERE s.post_count <> EXCLUDED.post_count
+                """,
+                [ids],
+            )
+            return ids[-1], cursor.rowcount
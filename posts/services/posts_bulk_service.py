@@ -0,0 +1,107 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
+from posts.models import Category, Post
+from posts.services.categories_cache_service import CategoriesCacheService
+
+
+class PostsBulkService:
+    """
+    Set-wise writes for many posts at once: one INSERT/UPDATE per statement
+    type instead of one round trip (and one M2M insert) per post.
+    """
+
+    categories_model = Post.categories.through
+    cache_service = CategoriesCacheService()
+
+    @transaction.atomic
+    def create(self, owner: User, items: list[dict]) -> list[Post]:
+        items = [dict(item) for item in items]
+        categories = [item.pop("categories", []) for item in items]
+        posts = Post.objects.bulk_create([Post(owner=owner, **item) for item in items])
+        self.add_categories(zip(posts, categories))
+        return posts
+
+    @transaction.atomic
+    def update(self, posts: list[Post], items: list[dict]) -> None:
+        now = timezone.now()
+        posts_by_fields = defaultdict(list)
+        replaced_categories = []
+        for post, item in zip(posts, items):
+            item = dict(item)
+            if "categories" in item:
+                replaced_categories.append((post, item.pop("categories")))
+            for field, value in item.items():
+                setattr(post, field, value)
+            post.updated_at = now
+            posts_by_fields[frozenset(item) | {"updated_at"}].append(post)
+
+        # Only write the columns that were actually sent, e.g. don't rewrite
+        # every `content` when a client only retitles posts.
+        for fields, same_fields_posts in posts_by_fields.items():
+            Post.objects.bulk_update(same_fields_posts, sorted(fields))
+
+        if replaced_categories:
+            self.__remove_categories(
+                self.categories_model.objects.filter(
+                    post_id__in=[post.id for post, _ in replaced_categories]
+                )
+            )
+            self.add_categories(replaced_categories)
+
+    @transaction.atomic
+    def delete(self, owner: User, ids: Iterable[int]) -> set[int]:
+        posts = Post.objects.filter(owner=owner, pk__in=ids)
+        deleted = set(posts.values_list("id", flat=True))
+        posts.filter(pk__in=deleted).delete()
+        return deleted
+
+    @transaction.atomic(savepoint=False)
+    def set_categories(self, post: Post, categories: list[Category]) -> None:
+        """
+        Replaces the categories of `post` with one DELETE of those it loses
+        and one INSERT of the others, without reading the current ones first.
+        """
+        self.__remove_categories(
+            self.categories_model.objects.filter(post_id=post.id).exclude(
+                category_id__in=[category.tag for category in categories]
+            )
+        )
+        self.add_categories([(post, categories)])
+
+    def add_categories(
+        self,
+        posts_categories: Iterable[tuple[Post, list[Category]]],
+    ) -> None:
+        memberships = [
+            (post.id, category.tag)
+            for post, categories in posts_categories
+            for category in categories
+        ]
+        if not memberships:
+            return
+        post_ids, category_ids = zip(*memberships)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.categories_model._meta.db_table}
+                    (post_id, category_id)
+                SELECT * FROM unnest(%s::bigint[], %s::varchar[])
+                ON CONFLICT DO NOTHING
+                """,
+                [list(post_ids), list(category_ids)],
+            )
+            inserted = cursor.rowcount
+        # Categories' post counts changed behind the signals' back, unless
+        # the posts had all of these categories already.
+        if inserted:
+            transaction.on_commit(self.cache_service.bump_version)
+
+    def __remove_categories(self, memberships) -> None:
+        deleted, _ = memberships.delete()
+        if deleted:
+            transaction.on_commit(self.cache_service.bump_version)
@@ -0,0 +1,124 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+
+from posts.exceptions import UnknownOwnersError
+from posts.models import Category, Post
+from posts.services.categories_cache_service import CategoriesCacheService
+
+# (line, title, content, owner username, category tags, created_at, updated_at)
+ImportRow = tuple[int, str, str, str, list[str], datetime | None, datetime | None]
+
+
+class PostsImportService:
+    """
+    Loads posts with `COPY ... FROM STDIN` into a temporary staging table,
+    then resolves owners and categories and fills the real tables with one
+    INSERT ... SELECT each, instead of one ORM save per post.
+
+    Call `prepare` once and `import_batch` per batch, inside one transaction.
+    """
+
+    staging_table = "posts_import_staging"
+    staging_types = (
+        "int8",
+        "text",
+        "text",
+        "text",
+        "text[]",
+        "timestamptz",
+        "timestamptz",
+    )
+    unknown_owners_limit = 10
+    cache_service = CategoriesCacheService()
+
+    def prepare(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_get_serial_sequence(%s, 'id')", [Post._meta.db_table]
+            )
+            (sequence,) = cursor.fetchone()
+            # Ids are drawn while copying, so posts and their category rows
+            # can be inserted from the same staging rows.
+            cursor.execute(
+                f"""
+                CREATE TEMPORARY TABLE IF NOT EXISTS {self.staging_table} (
+                    line bigint NOT NULL,
+                    title text NOT NULL,
+                    content text NOT NULL,
+                    owner text NOT NULL,
+                    categories text[] NOT NULL,
+                    created_at timestamptz,
+                    updated_at timestamptz,
+                    post_id bigint NOT NULL DEFAULT nextval(%s::regclass)
+                ) ON COMMIT DROP
+                """,
+                [sequence],
+            )
+            # Check foreign keys per statement instead of queueing one check
+            # per row until commit, which grows with the whole import.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        # Categories are written behind the signals' back.
+        transaction.on_commit(self.cache_service.bump_version)
+
+    def import_batch(self, rows: Iterable[ImportRow]) -> int:
+        posts_table = Post._meta.db_table
+        categories_table = Category._meta.db_table
+        memberships_table = Post.categories.through._meta.db_table
+        users_table = User._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {self.staging_table}")
+            with cursor.copy(
+                f"COPY {self.staging_table} "
+                "(line, title, content, owner, categories, created_at, updated_at) "
+                "FROM STDIN"
+            ) as copy:
+                copy.set_types(self.staging_types)
+                for row in rows:
+                    copy.write_row(row)
+
+            cursor.execute(
+                f"""
+                SELECT s.line, s.owner FROM {self.staging_table} s
+                WHERE NOT EXISTS (
+                    SELECT FROM {users_table} u WHERE u.username = s.owner
+                )
+                ORDER BY s.line LIMIT %s
+                """,
+                [self.unknown_owners_limit],
+            )
+            if unknown := dict(cursor.fetchall()):
+                raise UnknownOwnersError(unknown)
+
+            cursor.execute(
+                f"""
+                INSERT INTO {categories_table} (tag, name, post_count)
+                SELECT DISTINCT tag, tag, 0
+                FROM {self.staging_table}, unnest(categories) AS tag
+                ON CONFLICT (tag) DO NOTHING
+                """
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {posts_table}
+                    (id, title, content, owner_id, created_at, updated_at)
+                SELECT
+                    s.post_id, s.title, s.content, u.id,
+                    coalesce(s.created_at, now()),
+                    coalesce(s.updated_at, s.created_at, now())
+                FROM {self.staging_table} s
+                JOIN {users_table} u ON u.username = s.owner
+                """
+            )
+            imported = cursor.rowcount
+            cursor.execute(
+                f"""
+                INSERT INTO {memberships_table} (post_id, category_id)
+                SELECT DISTINCT s.post_id, tag
+                FROM {self.staging_table} s, unnest(s.categories) AS tag
+                """
+            )
+        return imported
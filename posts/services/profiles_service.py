@@ -0,0 +1,96 @@
+from django.contrib.auth.models import User
+from django.db import connection
+
+from posts.models import Profile
+
+
+class ProfilesService:
+    """
+    Profile writes as single statements keyed by the owner, returning the
+    written row, so none of them has to read the profile first.
+    """
+
+    def upsert(self, owner: User, values: dict) -> tuple[Profile, bool]:
+        # Like a fresh create, fields that weren't sent get their defaults.
+        fields = self.__get_value_fields()
+        values = {
+            field: values.get(field.name, field.get_default()) for field in fields
+        }
+        owner_column = self.__quote(Profile._meta.get_field("owner").column)
+        columns = ", ".join(self.__quote(field.column) for field in fields)
+        updates = ", ".join(
+            f"{self.__quote(field.column)} = EXCLUDED.{self.__quote(field.column)}"
+            for field in fields
+        )
+        placeholders = ", ".join(["%s"] * (len(fields) + 1))
+
+        with connection.cursor() as cursor:
+            # `xmax` is only set on rows that already existed.
+            cursor.execute(
+                f"""
+                INSERT INTO {Profile._meta.db_table} ({owner_column}, {columns})
+                VALUES ({placeholders})
+                ON CONFLICT ({owner_column}) DO UPDATE SET {updates}
+                RETURNING {self.__get_returning()}, xmax = 0
+                """,
+                [owner.pk, *self.__prepare(values)],
+            )
+            *row, created = cursor.fetchone()
+        return self.__from_row(row), created
+
+    def update(self, owner: User, values: dict) -> Profile | None:
+        if not values:
+            return Profile.objects.filter(owner=owner).first()
+
+        fields = {
+            Profile._meta.get_field(name): value for name, value in values.items()
+        }
+        updates = ", ".join(f"{self.__quote(field.column)} = %s" for field in fields)
+        owner_column = self.__quote(Profile._meta.get_field("owner").column)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {Profile._meta.db_table} SET {updates}
+                WHERE {owner_column} = %s
+                RETURNING {self.__get_returning()}
+                """,
+                [*self.__prepare(fields), owner.pk],
+            )
+            row = cursor.fetchone()
+        return None if row is None else self.__from_row(row)
+
+    def delete(self, owner: User) -> bool:
+        deleted, _ = Profile.objects.filter(owner=owner).delete()
+        return bool(deleted)
+
+    @staticmethod
+    def __get_value_fields() -> list:
+        return [
+            field
+            for field in Profile._meta.concrete_fields
+            if not field.primary_key and field.name != "owner"
+        ]
+
+    def __get_returning(self) -> str:
+        return ", ".join(
+            self.__quote(field.column) for field in Profile._meta.concrete_fields
+        )
+
+    @staticmethod
+    def __prepare(values: dict) -> list:
+        return [
+            field.get_db_prep_save(value, connection) for field, value in values.items()
+        ]
+
+    @staticmethod
+    def __from_row(row) -> Profile:
+        return Profile.from_db(
+            connection.alias,
+            [field.attname for field in Profile._meta.concrete_fields],
+            row,
+        )
+
+    @staticmethod
+    def __quote(name: str) -> str:
+        return connection.ops.quote_name(name)
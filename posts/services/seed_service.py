@@ -0,0 +1,247 @@
+import itertools
+import random
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+
+from posts.models import Category, Post, Profile
+from posts.services.categories_cache_service import CategoriesCacheService
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua enim ad minim veniam "
+    "quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo "
+    "consequat duis aute irure in reprehenderit voluptate velit esse cillum "
+    "fugiat nulla pariatur excepteur sint occaecat cupidatat non proident "
+    "sunt culpa qui officia deserunt mollit anim id est laborum"
+).split()
+
+
+class SeedService:
+    """
+    Generates users, profiles, categories, posts and their categories from a
+    seed, written with COPY rather than one ORM save per row. Post owners and
+    categories follow a Zipf-like skew, so a few authors and tags hold most
+    of the posts, as on real blogs. Timestamps are relative to the time of
+    seeding.
+
+    Call `prepare_posts` once before `create_posts`; every `create_*` call
+    writes one batch, in the caller's transaction.
+    """
+
+    paragraph_count = 1000
+    # How many categories a post has, and how often.
+    categories_per_post = (0, 1, 2, 3, 4, 5)
+    categories_per_post_weights = (10, 30, 30, 15, 10, 5)
+    search_vector_trigger = "posts_post_search_vector_trigger"
+    cache_service = CategoriesCacheService()
+
+    def __init__(self, seed: int = 0, skew: float = 1.1, password: str = "seed"):
+        self.rng = random.Random(seed)
+        self.skew = skew
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        # Hashing is deliberately slow, so every user shares one hash.
+        self.password = make_password(password)
+        # Content is drawn from a pool of paragraphs, which is much cheaper
+        # than joining random words for every post.
+        self.paragraphs = [
+            " ".join(self.rng.choices(WORDS, k=self.rng.randint(20, 120)))
+            for _ in range(self.paragraph_count)
+        ]
+
+    def create_users(self, count: int, profiles: float = 0.5) -> range:
+        """Creates `count` users, `profiles` of them with a profile."""
+        ids = self.__reserve_ids(User, count)
+        self.__copy(
+            User,
+            ("id", "password", "is_superuser", "username", "first_name")
+            + ("last_name", "email", "is_staff", "is_active", "date_joined"),
+            (
+                (
+                    id,
+                    self.password,
+                    False,
+                    f"user{id}",
+                    self.rng.choice(WORDS).title(),
+                    self.rng.choice(WORDS).title(),
+                    f"user{id}@example.com",
+                    False,
+                    True,
+                    self.__past(),
+                )
+                for id in ids
+            ),
+        )
+        self.__copy(
+            Profile,
+            ("bio", "preferences", "owner_id"),
+            (
+                (self.rng.choice(self.paragraphs)[:500], "", id)
+                for id in ids
+                if self.rng.random() < profiles
+            ),
+        )
+        return ids
+
+    def create_categories(self, count: int) -> list[str]:
+        """Creates the categories `b0` to `b<count - 1>` that don't exist yet."""
+        tags = [f"b{number}" for number in range(count)]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Category._meta.db_table} (tag, name, post_count)
+                SELECT tag, 'Category ' || tag, 0 FROM unnest(%s::text[]) AS tag
+                ON CONFLICT (tag) DO NOTHING
+                """,
+                [tags],
+            )
+        transaction.on_commit(self.cache_service.bump_version)
+        return tags
+
+    def prepare_posts(self) -> None:
+        # Each paragraph's search vector is computed here once, rather than
+        # by the trigger for every post that uses it.
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS seed_paragraphs, seed_posts")
+            cursor.execute(
+                """
+                CREATE TEMPORARY TABLE seed_paragraphs (
+                    number int PRIMARY KEY, content text, vector tsvector
+                )
+                """
+            )
+            cursor.execute(
+                """
+                INSERT INTO seed_paragraphs
+                SELECT number - 1, content, setweight(
+                    to_tsvector('pg_catalog.english', content), 'B'
+                )
+                FROM unnest(%s::text[]) WITH ORDINALITY AS p(content, number)
+                """,
+                [self.paragraphs],
+            )
+            cursor.execute(
+                """
+                CREATE TEMPORARY TABLE seed_posts (
+                    id bigint, title text, paragraph int,
+                    created_at timestamptz, updated_at timestamptz, owner_id int
+                )
+                """
+            )
+
+    def create_posts(self, count: int, user_ids: list[int], tags: list[str]) -> range:
+        """
+        Creates `count` posts owned by `user_ids`, with categories from
+        `tags`; the first ids and tags get the most posts.
+        """
+        owners = self.rng.choices(
+            user_ids, cum_weights=self.__get_zipf_weights(len(user_ids)), k=count
+        )
+        tag_weights = self.__get_zipf_weights(len(tags))
+        ids = self.__reserve_ids(Post, count)
+        rows = []
+        memberships = []
+        for id, owner in zip(ids, owners):
+            created_at = self.__past()
+            rows.append(
+                (
+                    id,
+                    " ".join(self.rng.choices(WORDS, k=self.rng.randint(2, 8))),
+                    self.rng.randrange(self.paragraph_count),
+                    created_at,
+                    created_at + timedelta(seconds=self.rng.randint(0, 86400)),
+                    owner,
+                )
+            )
+            if not tags:
+                continue
+            [categories] = self.rng.choices(
+                self.categories_per_post, weights=self.categories_per_post_weights
+            )
+            post_tags = self.rng.choices(tags, cum_weights=tag_weights, k=categories)
+            # Sorted, as set order varies between processes.
+            memberships.extend((id, tag) for tag in sorted(set(post_tags)))
+
+        self.__insert_posts(rows)
+        self.__copy(Post.categories.through, ("post_id", "category_id"), memberships)
+        # Category post counts have changed behind the signals' back.
+        transaction.on_commit(self.cache_service.bump_version)
+        return ids
+
+    @staticmethod
+    def analyze() -> None:
+        with connection.cursor() as cursor:
+            for model in (User, Profile, Category, Post, Post.categories.through):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def __insert_posts(self, rows: list[tuple]) -> None:
+        table = Post._meta.db_table
+        with connection.cursor() as cursor:
+            # Pending foreign key checks would keep the trigger from being
+            # disabled in this transaction.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute("TRUNCATE seed_posts")
+            self.__copy_into(
+                cursor,
+                "seed_posts",
+                ("id", "title", "paragraph", "created_at", "updated_at", "owner_id"),
+                rows,
+            )
+            # The same vector as the trigger computes. The table stays locked
+            # until commit, so no other write gets past the disabled trigger.
+            cursor.execute(
+                f"ALTER TABLE {table} DISABLE TRIGGER {self.search_vector_trigger}"
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (
+                    id, title, content, created_at, updated_at, owner_id,
+                    search_vector
+                )
+                SELECT
+                    s.id, s.title, p.content, s.created_at, s.updated_at,
+                    s.owner_id,
+                    setweight(to_tsvector('pg_catalog.english', s.title), 'A')
+                    || p.vector
+                FROM seed_posts s JOIN seed_paragraphs p ON p.number = s.paragraph
+                """
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ENABLE TRIGGER {self.search_vector_trigger}"
+            )
+
+    def __get_zipf_weights(self, count: int) -> list[float]:
+        return list(
+            itertools.accumulate(1 / rank**self.skew for rank in range(1, count + 1))
+        )
+
+    def __past(self) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randint(0, 3 * 365 * 86400))
+
+    @staticmethod
+    def __reserve_ids(model, count: int) -> range:
+        # Writers wait for this transaction, so nobody else draws ids from
+        # the block taken here.
+        if not count:
+            return range(0)
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
+            cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+            (sequence,) = cursor.fetchone()
+            cursor.execute("SELECT nextval(%s)", [sequence])
+            (start,) = cursor.fetchone()
+            cursor.execute("SELECT setval(%s, %s)", [sequence, start + count - 1])
+        return range(start, start + count)
+
+    def __copy(self, model, columns: tuple[str, ...], rows) -> None:
+        with connection.cursor() as cursor:
+            self.__copy_into(cursor, model._meta.db_table, columns, rows)
+
+    @staticmethod
+    def __copy_into(cursor, table: str, columns: tuple[str, ...], rows) -> None:
+        with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
@@ -1,12 +0,0 @@
-from django.contrib.auth.models import User
-
-from posts.models import Profile
-
-
-class UsersService:
-    def has_profile(self, user: User) -> bool:
-        try:
-            user.profile  # noqa
-            return True
-        except Profile.DoesNotExist:
-            return False
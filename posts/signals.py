@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from posts.models import Category, Post
+from posts.services import CategoriesCacheService
+
+
+@receiver((post_save, post_delete), sender=Category)
+def invalidate_categories_cache(sender, **kwargs):
+    # Bumping before commit would let a concurrent read cache the old rows
+    # under the new version.
+    transaction.on_commit(CategoriesCacheService().bump_version)
+
+
+# Categories' post counts change with their posts. Clears don't tell which
+# memberships they removed, while adds and removes that change nothing come
+# with an empty `pk_set`.
+@receiver(m2m_changed, sender=Post.categories.through)
+def invalidate_categories_cache_on_membership(
+    sender, action: str, pk_set: set | None, **kwargs
+):
+    if action == "post_clear" or (action in ("post_add", "post_remove") and pk_set):
+        transaction.on_commit(CategoriesCacheService().bump_version)
+
+
+# Also when the posts go with their owner.
+@receiver(post_delete, sender=Post)
+def invalidate_categories_cache_on_post_delete(sender, **kwargs):
+    transaction.on_commit(CategoriesCacheService().bump_version)
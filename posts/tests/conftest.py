@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+
+import pytest
+from django.core.cache import cache
+
+from blog_drf.db.instrumentation import QueryBudgetExceeded, recording_queries
+from posts.services import SeedService
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # The database is rolled back after every test, cached responses are not.
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings):
+    # Requests over their view's `query_budget` fail the test.
+    settings.QUERY_BUDGETS_RAISE = True
+
+
+@pytest.fixture
+def query_budget():
+    """
+    `with query_budget(5, duplicates=0):` fails the test if the block makes
+    more queries, or repeats more statements, than allowed.
+    """
+
+    @contextmanager
+    def check(queries: int, duplicates: int | None = None):
+        with recording_queries() as stats:
+            yield stats
+        if stats.count > queries:
+            raise QueryBudgetExceeded(
+                f"{stats.count} queries, over the budget of {queries}."
+            )
+        if duplicates is not None and stats.duplicates > duplicates:
+            raise QueryBudgetExceeded(
+                f"{stats.duplicates} duplicate queries, over the budget of "
+                f"{duplicates}: {stats.get_duplicated()}"
+            )
+
+    return check
+
+
+@pytest.fixture
+def seed_data(db):
+    """
+    `seed_data(users=10, posts=100)` writes rows as `manage.py seed` does, in
+    bulk and in the test's transaction, and returns the user ids and tags.
+    """
+
+    def seed(users=10, posts=100, categories=5, profiles=0.5, seed=0):
+        seed_service = SeedService(seed=seed)
+        user_ids = list(seed_service.create_users(users, profiles))
+        tags = seed_service.create_categories(categories)
+        seed_service.prepare_posts()
+        seed_service.create_posts(posts, user_ids, tags)
+        return user_ids, tags
+
+    return seed
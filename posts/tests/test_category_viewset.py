@@ -17,7 +17,7 @@ class TestCategoryView:
         response = admin_client.post("/categories/", data=attributes)
 
         assert response.status_code == 201
-        assert response.json() == attributes
+        assert response.json() == attributes | {"post_count": 0}
 
     def test_update_by_admin(self, admin_client):
         stored = CategoryFactory()
@@ -30,7 +30,7 @@ class TestCategoryView:
         )
 
         assert response.status_code == 200
-        assert response.json() == attributes
+        assert response.json() == attributes | {"post_count": 0}
 
     def test_delete_by_admin(self, admin_client):
         stored = CategoryFactory()
@@ -54,6 +54,7 @@ class TestCategoryView:
                 {
                     "tag": stored_category.tag,
                     "name": stored_category.name,
+                    "post_count": 0,
                 }
             ],
         }
@@ -68,8 +69,61 @@ class TestCategoryView:
         assert response.json() == {
             "tag": stored_category.tag,
             "name": stored_category.name,
+            "post_count": 0,
         }
 
+    @pytest.mark.django_db
+    def test_get_page_twice_hits_database_once(self, django_assert_num_queries):
+        CategoryFactory()
+
+        first_response = self.client.get("/categories/")
+        with django_assert_num_queries(0):
+            second_response = self.client.get("/categories/")
+
+        assert second_response.status_code == 200
+        assert second_response.content == first_response.content
+
+    def test_get_page_after_update_by_admin(
+        self,
+        admin_client,
+        django_capture_on_commit_callbacks,
+    ):
+        stored = CategoryFactory()
+        self.client.get("/categories/")
+        self.client.get(f"/categories/{stored.tag}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            admin_client.put(
+                f"/categories/{stored.tag}/",
+                data={"tag": stored.tag, "name": "upd-name"},
+                content_type="application/json",
+            )
+        page_response = self.client.get("/categories/")
+        one_response = self.client.get(f"/categories/{stored.tag}/")
+
+        assert page_response.json()["results"] == [
+            {"tag": stored.tag, "name": "upd-name", "post_count": 0}
+        ]
+        assert one_response.json() == {
+            "tag": stored.tag,
+            "name": "upd-name",
+            "post_count": 0,
+        }
+
+    def test_get_page_after_delete_by_admin(
+        self,
+        admin_client,
+        django_capture_on_commit_callbacks,
+    ):
+        stored = CategoryFactory()
+        self.client.get("/categories/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            admin_client.delete(f"/categories/{stored.tag}/")
+        response = self.client.get("/categories/")
+
+        assert response.json()["count"] == 0
+
     def test_create_by_not_admin_user_error(self):
         response = self.client.post("/categories/", data={})
 
@@ -0,0 +1,90 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from posts.models import Category, Post
+from posts.tests.factories import CategoryFactory, UserFactory
+
+
+class TestImportPostsCommand:
+    @pytest.mark.django_db
+    def test_import_ndjson(self, tmp_path):
+        owner = UserFactory()
+        stored_category = CategoryFactory()
+        path = tmp_path / "posts.ndjson"
+        path.write_text(
+            "\n".join(
+                json.dumps(record)
+                for record in (
+                    {
+                        "title": "first",
+                        "content": "first content",
+                        "owner": owner.username,
+                        "categories": [stored_category.tag, "new"],
+                        "created_at": "2020-01-01T00:00:00Z",
+                    },
+                    {"title": "second", "owner": owner.username},
+                )
+            )
+        )
+
+        call_command("import_posts", str(path))
+
+        first, second = Post.objects.order_by("id")
+        assert (first.title, first.content, first.owner) == (
+            "first",
+            "first content",
+            owner,
+        )
+        assert first.created_at == datetime(2020, 1, 1, tzinfo=timezone.utc)
+        assert first.updated_at == first.created_at
+        assert sorted(first.categories.values_list("tag", flat=True)) == sorted(
+            [stored_category.tag, "new"]
+        )
+        assert Category.objects.get(tag="new").name == "new"
+        assert (second.title, second.content) == ("second", "")
+        assert not second.categories.exists()
+        assert Post.objects.filter(search_vector="first").get() == first
+
+    @pytest.mark.django_db
+    def test_import_csv(self, tmp_path):
+        owner = UserFactory()
+        path = tmp_path / "posts.csv"
+        path.write_text(
+            "title,content,owner,categories\n"
+            f'"a, title","multi\nline",{owner.username},one;two\n'
+        )
+
+        call_command("import_posts", str(path), batch_size=1)
+
+        post = Post.objects.get()
+        assert (post.title, post.content) == ("a, title", "multi\nline")
+        assert sorted(post.categories.values_list("tag", flat=True)) == [
+            "one",
+            "two",
+        ]
+
+    @pytest.mark.django_db
+    def test_import_with_unknown_owner_error(self, tmp_path):
+        owner = UserFactory()
+        path = tmp_path / "posts.ndjson"
+        path.write_text(
+            json.dumps({"title": "kept", "owner": owner.username})
+            + "\n"
+            + json.dumps({"title": "lost", "owner": "nobody"})
+        )
+
+        with pytest.raises(CommandError, match="'nobody' \\(line 2\\)"):
+            call_command("import_posts", str(path), batch_size=1)
+
+        assert not Post.objects.exists()
+
+    @pytest.mark.django_db
+    def test_import_with_invalid_record_error(self, tmp_path):
+        path = tmp_path / "posts.ndjson"
+        path.write_text(json.dumps({"title": "", "owner": "someone"}))
+
+        with pytest.raises(CommandError, match="Line 1: `title`"):
+            call_command("import_posts", str(path))
@@ -0,0 +1,258 @@
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from posts.models import Category, Post, UserStats
+from posts.serializers import CategorySerializer
+from posts.tests.factories import CategoryFactory, PostFactory, UserFactory
+
+
+def get_category_counts() -> dict[str, int]:
+    return dict(Category.objects.values_list("tag", "post_count"))
+
+
+def get_user_counts() -> dict[int, int]:
+    return dict(UserStats.objects.values_list("owner_id", "post_count"))
+
+
+@pytest.mark.django_db
+class TestPostCounters:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_create_and_delete_posts(self):
+        first, second = CategoryFactory.create_batch(2)
+        owner = UserFactory()
+        posts = PostFactory.create_batch(2, owner=owner, categories=[first])
+        PostFactory(owner=owner, categories=[first, second])
+
+        assert get_category_counts() == {first.tag: 3, second.tag: 1}
+        assert get_user_counts() == {owner.id: 3}
+
+        Post.objects.filter(pk__in=[post.id for post in posts]).delete()
+
+        assert get_category_counts() == {first.tag: 1, second.tag: 1}
+        assert get_user_counts() == {owner.id: 1}
+
+    def test_change_categories(self):
+        first, second, third = CategoryFactory.create_batch(3)
+        post = PostFactory(categories=[first, second])
+
+        post.categories.add(third)
+        post.categories.remove(first)
+        assert get_category_counts() == {first.tag: 0, second.tag: 1, third.tag: 1}
+
+        post.categories.clear()
+        assert get_category_counts() == {first.tag: 0, second.tag: 0, third.tag: 0}
+
+    def test_change_owner(self):
+        post = PostFactory()
+        old_owner_id = post.owner_id
+        new_owner = UserFactory()
+
+        post.owner = new_owner
+        post.save()
+
+        assert get_user_counts() == {old_owner_id: 0, new_owner.id: 1}
+
+    def test_cascade_deletes(self):
+        category = CategoryFactory()
+        kept = PostFactory(categories=[category])
+        removed = PostFactory(categories=[category])
+
+        removed.owner.delete()
+        assert get_category_counts() == {category.tag: 1}
+        assert get_user_counts() == {kept.owner_id: 1}
+
+        category.delete()
+        assert not kept.categories.exists()
+
+    def test_save_category_keeps_count(self):
+        category = CategoryFactory()
+        PostFactory(categories=[category])
+
+        category.name = "renamed"
+        category.save()
+
+        assert Category.objects.get().post_count == 1
+
+    def test_update_category_keeps_count(self):
+        category = CategoryFactory()
+        PostFactory(categories=[category])
+        serializer = CategorySerializer(
+            category, data={"tag": category.tag, "name": "renamed"}
+        )
+
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        assert Category.objects.get().post_count == 1
+
+    def test_bulk_writes(self, django_user_model):
+        owner = django_user_model.objects.create_user("owner")
+        first, second = CategoryFactory.create_batch(2)
+        self.client.force_login(owner)
+
+        response = self.client.post(
+            "/posts/bulk/",
+            data=[{"title": str(i), "categories": [first.tag]} for i in range(3)],
+            format="json",
+        )
+        ids = [post["id"] for post in response.json()]
+        assert get_category_counts() == {first.tag: 3, second.tag: 0}
+        assert get_user_counts() == {owner.id: 3}
+
+        self.client.patch(
+            "/posts/bulk/",
+            data=[{"id": ids[0], "categories": [second.tag]}],
+            format="json",
+        )
+        assert get_category_counts() == {first.tag: 2, second.tag: 1}
+
+        self.client.delete("/posts/bulk/", data={"ids": ids[1:]}, format="json")
+        assert get_category_counts() == {first.tag: 0, second.tag: 1}
+        assert get_user_counts() == {owner.id: 1}
+
+    def test_import(self, tmp_path):
+        owner = UserFactory()
+        path = tmp_path / "posts.csv"
+        path.write_text(
+            "title,owner,categories\n"
+            f"first,{owner.username},one;two\n"
+            f"second,{owner.username},one\n"
+        )
+
+        call_command("import_posts", str(path), batch_size=1)
+
+        assert get_category_counts() == {"one": 2, "two": 1}
+        assert get_user_counts() == {owner.id: 2}
+
+    def test_exposed_in_serializers(self, django_user_model):
+        category = CategoryFactory()
+        owner = PostFactory(categories=[category]).owner
+        no_posts = UserFactory()
+        self.client.force_login(django_user_model.objects.create_user("viewer"))
+
+        category_response = self.client.get(f"/categories/{category.tag}/")
+        owner_response = self.client.get(f"/users/{owner.id}/")
+        no_posts_response = self.client.get(f"/users/{no_posts.id}/")
+
+        assert category_response.json()["post_count"] == 1
+        assert owner_response.json()["post_count"] == 1
+        assert no_posts_response.json()["post_count"] == 0
+
+    def test_category_cache_after_new_post(self, django_capture_on_commit_callbacks):
+        category = CategoryFactory()
+        self.client.get(f"/categories/{category.tag}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            PostFactory(categories=[category])
+        response = self.client.get(f"/categories/{category.tag}/")
+
+        assert response.json()["post_count"] == 1
+
+    def test_category_cache_after_post_delete(
+        self,
+        django_capture_on_commit_callbacks,
+    ):
+        category = CategoryFactory()
+        post = PostFactory(categories=[category])
+        self.client.get(f"/categories/{category.tag}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Post.objects.filter(pk=post.pk).delete()
+        response = self.client.get(f"/categories/{category.tag}/")
+
+        assert response.json()["post_count"] == 0
+
+    def test_unchanged_memberships_keep_category_cache(
+        self,
+        django_capture_on_commit_callbacks,
+    ):
+        category = CategoryFactory()
+        post = PostFactory(categories=[category])
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            post.categories.add(category)
+            post.categories.set([category])
+
+        assert callbacks == []
+
+    def test_category_cache_after_post_writes(
+        self,
+        django_user_model,
+        django_capture_on_commit_callbacks,
+    ):
+        category = CategoryFactory()
+        self.client.force_login(django_user_model.objects.create_user("owner"))
+        self.client.get(f"/categories/{category.tag}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            post_id = self.client.post(
+                "/posts/",
+                data={"title": "title", "categories": [category.tag]},
+                format="json",
+            ).json()["id"]
+        created = self.client.get(f"/categories/{category.tag}/")
+        with django_capture_on_commit_callbacks(execute=True):
+            self.client.patch(
+                f"/posts/{post_id}/", data={"categories": []}, format="json"
+            )
+        updated = self.client.get(f"/categories/{category.tag}/")
+        with django_capture_on_commit_callbacks(execute=True):
+            self.client.put(
+                f"/posts/{post_id}/",
+                data={"title": "title", "categories": [category.tag]},
+                format="json",
+            )
+        readded = self.client.get(f"/categories/{category.tag}/")
+        with django_capture_on_commit_callbacks(execute=True):
+            self.client.delete(f"/posts/{post_id}/")
+        deleted = self.client.get(f"/categories/{category.tag}/")
+
+        assert created.json()["post_count"] == 1
+        assert updated.json()["post_count"] == 0
+        assert readded.json()["post_count"] == 1
+        assert deleted.json()["post_count"] == 0
+
+    def test_unchanged_categories_keep_category_cache(
+        self,
+        django_user_model,
+        django_capture_on_commit_callbacks,
+    ):
+        owner = django_user_model.objects.create_user("owner")
+        category = CategoryFactory()
+        post = PostFactory(owner=owner, categories=[category])
+        self.client.force_login(owner)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = self.client.put(
+                f"/posts/{post.id}/",
+                data={"title": "retitled", "categories": [category.tag]},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert callbacks == []
+        assert get_category_counts() == {category.tag: 1}
+
+
+class TestRecountPostsCommand:
+    @pytest.mark.django_db(transaction=True)
+    def test_repairs_drift(self, capsys):
+        first, second, third = CategoryFactory.create_batch(3)
+        owner, other = UserFactory.create_batch(2)
+        PostFactory.create_batch(2, owner=owner, categories=[first, second])
+        without_stats = PostFactory(owner=other).owner
+        Category.objects.filter(pk=first.pk).update(post_count=7)
+        UserStats.objects.filter(owner=owner).update(post_count=0)
+        UserStats.objects.filter(owner=without_stats).delete()
+        UserFactory()
+
+        call_command("recount_posts", batch_size=2)
+
+        assert get_category_counts() == {first.tag: 2, second.tag: 2, third.tag: 0}
+        assert get_user_counts() == {owner.id: 2, other.id: 1}
+        output = capsys.readouterr().out
+        assert "Repaired 1 categories." in output
+        assert "Repaired 2 users." in output
@@ -1,9 +1,12 @@
+import json
+
 import pytest
 from rest_framework.test import APIClient
 
 from posts.models import Post
 from posts.tests.factories import CategoryFactory, PostFactory
 from posts.tests.util import datetime_to_iso
+from posts.views import PostViewSet
 
 
 class TestPostView:
@@ -27,6 +30,8 @@ class TestPostView:
             "id": stored_post.id,
             "title": stored_post.title,
             "content": stored_post.content,
+            "excerpt": stored_post.content,
+            "content_length": len(stored_post.content),
             "categories": [stored_category.tag],
             "created_at": datetime_to_iso(stored_post.created_at),
             "updated_at": datetime_to_iso(stored_post.updated_at),
@@ -49,7 +54,8 @@ class TestPostView:
                 {
                     "id": stored_post.id,
                     "title": stored_post.title,
-                    "content": stored_post.content,
+                    "excerpt": stored_post.content,
+                    "content_length": len(stored_post.content),
                     "categories": sorted([c.tag for c in stored_categories]),
                     "created_at": datetime_to_iso(stored_post.created_at),
                     "updated_at": datetime_to_iso(stored_post.updated_at),
@@ -59,6 +65,436 @@ class TestPostView:
             ],
         }
 
+    @pytest.mark.django_db
+    def test_get_pages_by_cursor_by_anonymous(self):
+        stored_posts = PostFactory.create_batch(3)
+
+        first_response = self.client.get("/posts/?page_size=2")
+        first_body = first_response.json()
+        second_response = self.client.get(first_body["next"])
+        second_body = second_response.json()
+
+        assert first_response.status_code == 200
+        assert set(first_body.keys()) == {"next", "previous", "results"}
+        assert first_body["previous"] is None
+        assert [p["id"] for p in first_body["results"]] == [
+            p.id for p in stored_posts[:2]
+        ]
+        assert second_response.status_code == 200
+        assert second_body["next"] is None
+        assert second_body["previous"] is not None
+        assert [p["id"] for p in second_body["results"]] == [stored_posts[2].id]
+
+    @pytest.mark.django_db
+    def test_get_pages_by_cursor_ordered_by_newest_first(self):
+        stored_posts = PostFactory.create_batch(3)
+
+        response = self.client.get("/posts/?page_size=2&ordering=-created_at")
+        next_response = self.client.get(response.json()["next"])
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["results"]] == [
+            stored_posts[2].id,
+            stored_posts[1].id,
+        ]
+        assert [p["id"] for p in next_response.json()["results"]] == [
+            stored_posts[0].id
+        ]
+
+    @pytest.mark.django_db
+    def test_get_page_by_tampered_cursor_error(self):
+        PostFactory.create_batch(3)
+        next_link = self.client.get("/posts/?page_size=2").json()["next"]
+
+        response = self.client.get(next_link.replace("cursor=", "cursor=x"))
+
+        assert response.status_code == 404
+
+    @pytest.mark.django_db
+    def test_get_page_by_cursor_from_another_ordering_error(self):
+        PostFactory.create_batch(3)
+        next_link = self.client.get("/posts/?page_size=2").json()["next"]
+
+        response = self.client.get(f"{next_link}&ordering=-id")
+
+        assert response.status_code == 404
+
+    @pytest.mark.django_db
+    def test_get_page_by_unsupported_ordering_error(self):
+        response = self.client.get("/posts/?ordering=title")
+
+        assert response.status_code == 400
+
+    @pytest.mark.django_db
+    def test_get_page_filtered_by_owner(self):
+        stored_post = PostFactory()
+        PostFactory()
+
+        response = self.client.get(f"/posts/?owner={stored_post.owner.id}")
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["results"]] == [stored_post.id]
+
+    @pytest.mark.django_db
+    def test_get_page_filtered_by_invalid_owner_error(self):
+        response = self.client.get("/posts/?owner=someone")
+
+        assert response.status_code == 400
+        assert set(response.json().keys()) == {"owner"}
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "query",
+        ("category={0}&category={1}", "category={0},{1}"),
+    )
+    def test_get_page_filtered_by_categories(self, query):
+        first_category, second_category = CategoryFactory.create_batch(2)
+        first_post = PostFactory(categories=[first_category])
+        both_post = PostFactory(categories=[first_category, second_category])
+        second_post = PostFactory(categories=[second_category])
+        PostFactory(categories=[CategoryFactory()])
+
+        response = self.client.get(
+            "/posts/?" + query.format(first_category.tag, second_category.tag)
+        )
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["results"]] == [
+            first_post.id,
+            both_post.id,
+            second_post.id,
+        ]
+
+    @pytest.mark.django_db
+    def test_get_page_filtered_by_dates(self):
+        old_post, middle_post, new_post = PostFactory.create_batch(3)
+        Post.objects.filter(id=old_post.id).update(
+            created_at="2020-01-01T00:00:00Z", updated_at="2020-01-01T00:00:00Z"
+        )
+        Post.objects.filter(id=middle_post.id).update(
+            created_at="2021-01-01T00:00:00Z", updated_at="2023-01-01T00:00:00Z"
+        )
+        Post.objects.filter(id=new_post.id).update(
+            created_at="2022-01-01T00:00:00Z", updated_at="2022-01-01T00:00:00Z"
+        )
+
+        created = self.client.get(
+            "/posts/?created_after=2020-06-01T00:00:00Z"
+            "&created_before=2022-01-01T00:00:00Z"
+        )
+        updated = self.client.get("/posts/?updated_since=2022-01-01T00:00:00Z")
+
+        assert [p["id"] for p in created.json()["results"]] == [middle_post.id]
+        assert [p["id"] for p in updated.json()["results"]] == [
+            middle_post.id,
+            new_post.id,
+        ]
+
+    @pytest.mark.django_db
+    def test_get_page_filtered_by_invalid_date_error(self):
+        response = self.client.get("/posts/?created_after=yesterday")
+
+        assert response.status_code == 400
+        assert set(response.json().keys()) == {"created_after"}
+
+    @pytest.mark.django_db
+    def test_export_by_anonymous(self, django_assert_num_queries, monkeypatch):
+        monkeypatch.setattr(PostViewSet, "export_chunk_size", 2)
+        category = CategoryFactory()
+        first_post, second_post, third_post = PostFactory.create_batch(
+            3, categories=[category]
+        )
+        PostFactory()
+        Post.objects.filter(id=first_post.id).update(updated_at="2030-01-01T00:00:00Z")
+
+        # One query, read chunk by chunk.
+        with django_assert_num_queries(1):
+            response = self.client.get(f"/posts/export/?category={category.tag}")
+            lines = b"".join(response.streaming_content).splitlines()
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        posts = [json.loads(line) for line in lines]
+        assert [p["id"] for p in posts] == [
+            second_post.id,
+            third_post.id,
+            first_post.id,
+        ]
+        assert posts[0]["categories"] == [category.tag]
+
+    @pytest.mark.django_db
+    def test_export_updated_since_by_anonymous(self):
+        old_post, new_post = PostFactory.create_batch(2)
+        Post.objects.filter(id=old_post.id).update(updated_at="2020-01-01T00:00:00Z")
+
+        response = self.client.get("/posts/export/?updated_since=2021-01-01T00:00:00Z")
+
+        lines = b"".join(response.streaming_content).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [new_post.id]
+
+    @pytest.mark.django_db
+    def test_export_sparse_fields_keep_watermark_by_anonymous(self):
+        stored_post = PostFactory()
+
+        response = self.client.get("/posts/export/?fields=title&exclude=id")
+
+        lines = b"".join(response.streaming_content).splitlines()
+        assert json.loads(lines[0]) == {
+            "id": stored_post.id,
+            "title": stored_post.title,
+            "updated_at": datetime_to_iso(stored_post.updated_at),
+        }
+
+    @pytest.mark.django_db
+    def test_export_with_invalid_filter_error(self):
+        response = self.client.get("/posts/export/?updated_since=yesterday")
+
+        assert response.status_code == 400
+        assert set(response.json().keys()) == {"updated_since"}
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("page_size", (1, 30, 100))
+    def test_get_page_by_anonymous_in_fixed_number_of_queries(
+        self,
+        django_assert_num_queries,
+        page_size,
+    ):
+        categories = CategoryFactory.create_batch(3)
+        PostFactory.create_batch(100, categories=categories)
+
+        # posts with their categories
+        with django_assert_num_queries(1):
+            response = self.client.get(f"/posts/?page_size={page_size}")
+        # count, posts with their categories
+        with django_assert_num_queries(2):
+            page_response = self.client.get(f"/posts/?page=1&page_size={page_size}")
+
+        assert len(response.json()["results"]) == page_size
+        assert len(page_response.json()["results"]) == page_size
+
+    @pytest.mark.django_db
+    def test_get_one_by_anonymous_in_fixed_number_of_queries(
+        self,
+        django_assert_num_queries,
+    ):
+        stored_post = PostFactory(categories=CategoryFactory.create_batch(10))
+
+        # post with its category tags
+        with django_assert_num_queries(1):
+            response = self.client.get(f"/posts/{stored_post.id}/")
+
+        assert len(response.json()["categories"]) == 10
+
+    @pytest.mark.django_db
+    def test_get_one_not_modified_by_anonymous(self, django_assert_num_queries):
+        stored_post = PostFactory()
+        response = self.client.get(f"/posts/{stored_post.id}/")
+
+        # validators only
+        with django_assert_num_queries(1):
+            not_modified_response = self.client.get(
+                f"/posts/{stored_post.id}/",
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+
+        assert response.status_code == 200
+        assert response["Last-Modified"]
+        assert not_modified_response.status_code == 304
+        assert not_modified_response["ETag"] == response["ETag"]
+        assert not not_modified_response.content
+
+    @pytest.mark.django_db
+    def test_get_page_with_fields_by_anonymous(self, django_assert_num_queries):
+        stored_posts = PostFactory.create_batch(
+            2, categories=CategoryFactory.create_batch(2)
+        )
+
+        # posts, without their content or categories
+        with django_assert_num_queries(1) as context:
+            response = self.client.get("/posts/?fields=title,id")
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": post.id, "title": post.title} for post in stored_posts
+        ]
+        [query] = context.captured_queries
+        assert "content" not in query["sql"] and "categories" not in query["sql"]
+
+    @pytest.mark.django_db
+    def test_get_one_with_excluded_fields_by_anonymous(self):
+        stored_category = CategoryFactory()
+        stored_post = PostFactory(categories=(stored_category,))
+
+        response = self.client.get(f"/posts/{stored_post.id}/?exclude=content,owner")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": stored_post.id,
+            "title": stored_post.title,
+            "excerpt": stored_post.content,
+            "content_length": len(stored_post.content),
+            "categories": [stored_category.tag],
+            "created_at": datetime_to_iso(stored_post.created_at),
+            "updated_at": datetime_to_iso(stored_post.updated_at),
+        }
+
+    @pytest.mark.django_db
+    def test_get_one_with_fields_in_browsable_api(self, django_assert_num_queries):
+        stored_post = PostFactory(categories=CategoryFactory.create_batch(2))
+
+        response = self.client.get(
+            f"/posts/{stored_post.id}/?fields=title", HTTP_ACCEPT="text/html"
+        )
+
+        assert response.status_code == 200
+        assert response.data == {"title": stored_post.title}
+        assert response.data.serializer.instance.get_deferred_fields() == {
+            "content",
+            "excerpt",
+            "content_length",
+            "owner_id",
+            "search_vector",
+        }
+
+    @pytest.mark.django_db
+    def test_get_page_with_fields_not_modified_by_anonymous(self):
+        PostFactory()
+        etag = self.client.get("/posts/")["ETag"]
+
+        response = self.client.get("/posts/?fields=id", HTTP_IF_NONE_MATCH=etag)
+        not_modified_response = self.client.get(
+            "/posts/?fields=id", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+
+        assert response.status_code == 200
+        assert not_modified_response.status_code == 304
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("query", ("fields=title,body", "exclude=body"))
+    def test_get_page_with_unknown_fields_error(self, query):
+        response = self.client.get(f"/posts/?{query}")
+
+        assert response.status_code == 400
+        assert response.json() == {query.split("=")[0]: ["Unknown fields: body."]}
+
+    @pytest.mark.django_db
+    def test_get_one_modified_by_anonymous(self):
+        stored_post = PostFactory()
+        etag = self.client.get(f"/posts/{stored_post.id}/")["ETag"]
+        stored_post.title = "new-title"
+        stored_post.save()
+
+        response = self.client.get(
+            f"/posts/{stored_post.id}/",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "new-title"
+        assert response["ETag"] != etag
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("query", ("", "?page=1"))
+    def test_get_page_not_modified_by_anonymous(self, query):
+        stored_posts = PostFactory.create_batch(2)
+        etag = self.client.get(f"/posts/{query}")["ETag"]
+
+        not_modified_response = self.client.get(
+            f"/posts/{query}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        stored_posts[1].save()
+        modified_response = self.client.get(f"/posts/{query}", HTTP_IF_NONE_MATCH=etag)
+
+        assert etag.startswith("W/")
+        assert not_modified_response.status_code == 304
+        assert modified_response.status_code == 200
+        assert [p["id"] for p in modified_response.json()["results"]] == [
+            p.id for p in stored_posts
+        ]
+
+    @pytest.mark.django_db
+    def test_get_page_without_last_modified_by_anonymous(self):
+        stored_post = PostFactory()
+        response = self.client.get("/posts/?page=1")
+        stored_post.delete()
+
+        modified_response = self.client.get(
+            "/posts/?page=1",
+            HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT",
+        )
+
+        assert "Last-Modified" not in response
+        assert modified_response.status_code == 200
+        assert modified_response.json()["results"] == []
+
+    @pytest.mark.django_db
+    def test_get_page_modified_by_new_post_by_anonymous(self):
+        PostFactory()
+        etag = self.client.get("/posts/?page=1")["ETag"]
+        PostFactory()
+
+        response = self.client.get("/posts/?page=1", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+
+    @pytest.mark.django_db
+    def test_search_by_anonymous(self):
+        content_match = PostFactory(title="weekly notes", content="Django tips")
+        title_match = PostFactory(title="Django tips", content="something else")
+        PostFactory(title="cooking", content="pasta recipes")
+
+        response = self.client.get("/posts/?search=django")
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+        assert [p["id"] for p in response.json()["results"]] == [
+            title_match.id,
+            content_match.id,
+        ]
+        assert "search_vector" not in response.json()["results"][0]
+
+    @pytest.mark.django_db
+    def test_search_by_anonymous_after_update(self):
+        post = PostFactory(title="cooking", content="pasta recipes")
+        post.content = "risotto recipes"
+        post.save()
+
+        old_response = self.client.get("/posts/?search=pasta")
+        new_response = self.client.get("/posts/?search=risotto")
+
+        assert old_response.json()["count"] == 0
+        assert [p["id"] for p in new_response.json()["results"]] == [post.id]
+
+    @pytest.mark.django_db
+    def test_get_page_with_excerpt_by_anonymous(self, django_assert_num_queries):
+        content = "  first\n\n  paragraph\t" + "word " * 100
+        post = PostFactory(content=content)
+
+        # count, posts without their content
+        with django_assert_num_queries(2) as context:
+            response = self.client.get("/posts/?page=1")
+
+        [result] = response.json()["results"]
+        assert "content" not in result
+        assert result["excerpt"] == ("first paragraph " + "word " * 100)[:200].strip()
+        assert result["content_length"] == len(content)
+        assert '"posts_post"."content",' not in context.captured_queries[1]["sql"]
+        assert self.client.get(f"/posts/{post.id}/").json()["content"] == content
+
+    @pytest.mark.django_db
+    def test_get_page_with_content_by_anonymous(self):
+        post = PostFactory(content="old content")
+        post.content = "new content"
+        post.save()
+
+        response = self.client.get("/posts/?fields=id,content,excerpt")
+
+        assert response.json()["results"] == [
+            {"id": post.id, "content": "new content", "excerpt": "new content"}
+        ]
+
     def test_update_by_anonymous_error(self):
         response = self.client.put("/posts/test-id/")
 
@@ -92,6 +528,8 @@ class TestPostView:
         post = Post.objects.get(pk=body["id"])
         assert body == {
             **attributes,
+            "excerpt": "test-content",
+            "content_length": 12,
             "id": post.id,
             "created_at": datetime_to_iso(post.created_at),
             "updated_at": datetime_to_iso(post.updated_at),
@@ -124,7 +562,8 @@ class TestPostView:
                     "categories": sorted([c.tag for c in categories]),
                     "id": post.id,
                     "title": post.title,
-                    "content": post.content,
+                    "excerpt": post.content,
+                    "content_length": len(post.content),
                     "owner": owner.id,
                     "created_at": datetime_to_iso(post.created_at),
                     "updated_at": datetime_to_iso(post.updated_at),
@@ -132,6 +571,20 @@ class TestPostView:
             ],
         }
 
+    def test_get_page_by_authenticated_user_within_query_budget(
+        self,
+        django_user_model,
+        query_budget,
+    ):
+        PostFactory.create_batch(5, categories=CategoryFactory.create_batch(2))
+        self.client.force_login(django_user_model.objects.create_user("viewer"))
+
+        # session, viewer, count, posts with their categories
+        with query_budget(4, duplicates=0):
+            response = self.client.get("/posts/?page=1")
+
+        assert len(response.json()["results"]) == 5
+
     def test_update_by_owner(self, django_user_model):
         categories = CategoryFactory.create_batch(2)
         owner = django_user_model.objects.create_user(username="test-owner")
@@ -150,6 +603,8 @@ class TestPostView:
         after_post = Post.objects.get(pk=before_post.id)
         assert response.json() == {
             **attributes,
+            "excerpt": "new_content",
+            "content_length": 11,
             "owner": owner.id,
             "created_at": datetime_to_iso(after_post.created_at),
             "updated_at": datetime_to_iso(after_post.updated_at),
@@ -177,6 +632,8 @@ class TestPostView:
             **attributes,
             "id": after_post.id,
             "content": after_post.content,
+            "excerpt": after_post.content,
+            "content_length": len(after_post.content),
             "owner": owner.id,
             "created_at": datetime_to_iso(after_post.created_at),
             "updated_at": datetime_to_iso(after_post.updated_at),
@@ -205,6 +662,72 @@ class TestPostView:
         assert response.status_code == 403
         assert Post.objects.get(pk=post.id)
 
+    def test_create_with_categories_in_fixed_number_of_queries(
+        self,
+        django_user_model,
+        django_assert_num_queries,
+    ):
+        user = django_user_model.objects.create_user("test-user")
+        tags = [c.tag for c in CategoryFactory.create_batch(10)]
+
+        self.client.force_login(user)
+        # session, user, categories, post, its categories, its excerpt,
+        # categories for the response
+        with django_assert_num_queries(7):
+            response = self.client.post(
+                "/posts/",
+                data={"title": "title", "content": "content", "categories": tags},
+                format="json",
+            )
+
+        assert response.status_code == 201
+        assert response.json()["categories"] == sorted(tags)
+
+    def test_create_with_unknown_categories_error(self, django_user_model):
+        user = django_user_model.objects.create_user("test-user")
+        stored_category = CategoryFactory()
+
+        self.client.force_login(user)
+        response = self.client.post(
+            "/posts/",
+            data={
+                "title": "title",
+                "categories": [stored_category.tag, "missing", "other"],
+            },
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "categories": ['Invalid pk "missing" - object does not exist.']
+        }
+        assert not Post.objects.exists()
+
+    def test_partial_update_of_categories_by_owner(
+        self,
+        django_user_model,
+        django_assert_num_queries,
+    ):
+        kept, dropped, added = CategoryFactory.create_batch(3)
+        owner = django_user_model.objects.create_user("test-owner")
+        post = PostFactory(categories=[kept, dropped], owner=owner)
+
+        self.client.force_login(owner)
+        # session, user, post, categories, post update, dropped categories,
+        # added categories, excerpt, categories for the response
+        with django_assert_num_queries(9):
+            response = self.client.patch(
+                f"/posts/{post.id}/",
+                data={"categories": [added.tag, kept.tag]},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert response.json()["categories"] == sorted([kept.tag, added.tag])
+        assert sorted(post.categories.values_list("tag", flat=True)) == sorted(
+            [kept.tag, added.tag]
+        )
+
     def test_create_by_authenticated_user_with_someone_else_id_in_body(
         self,
         django_user_model,
@@ -226,12 +749,50 @@ class TestPostView:
         created_post = Post.objects.get(pk=response.json()["id"])
         assert response.json() == {
             **attributes,
+            "excerpt": "test-content",
+            "content_length": 12,
             "id": created_post.id,
             "created_at": datetime_to_iso(created_post.created_at),
             "updated_at": datetime_to_iso(created_post.updated_at),
             "owner": owner.id,
         }
 
+    def test_partial_update_by_owner_with_current_etag(self, django_user_model):
+        owner = django_user_model.objects.create_user("test-owner")
+        post = PostFactory(owner=owner)
+        self.client.force_login(owner)
+        etag = self.client.get(f"/posts/{post.id}/")["ETag"]
+
+        response = self.client.patch(
+            f"/posts/{post.id}/",
+            data={"title": "new_title"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "new_title"
+        assert response["ETag"] != etag
+        assert response["ETag"] == self.client.get(f"/posts/{post.id}/")["ETag"]
+
+    def test_partial_update_by_owner_with_stale_etag_error(self, django_user_model):
+        owner = django_user_model.objects.create_user("test-owner")
+        post = PostFactory(owner=owner)
+        self.client.force_login(owner)
+        etag = self.client.get(f"/posts/{post.id}/")["ETag"]
+        post.title = "concurrent-title"
+        post.save()
+
+        response = self.client.patch(
+            f"/posts/{post.id}/",
+            data={"title": "new_title"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+
+        assert response.status_code == 412
+        assert Post.objects.get(pk=post.id).title == "concurrent-title"
+
     def test_partial_update_by_not_owner_error(self, django_user_model):
         categories = CategoryFactory.create_batch(2)
         owner = django_user_model.objects.create_user("test-owner")
@@ -265,3 +826,130 @@ class TestPostView:
         response = self.client.put(f"/posts/{post.id}/", data={})
 
         assert response.status_code == 403
+
+    def test_bulk_create_by_authenticated_user(self, django_user_model):
+        user = django_user_model.objects.create_user("test-user")
+        categories = CategoryFactory.create_batch(2)
+        attributes = [
+            {
+                "title": f"title-{i}",
+                "content": f"content-{i}",
+                "categories": [c.tag for c in categories],
+            }
+            for i in range(3)
+        ]
+
+        self.client.force_login(user)
+        response = self.client.post("/posts/bulk/", data=attributes, format="json")
+
+        assert response.status_code == 201
+        posts = Post.objects.filter(owner=user).prefetch_related("categories")
+        assert response.json() == [
+            {
+                "id": post.id,
+                "title": post.title,
+                "content": post.content,
+                "excerpt": post.content,
+                "content_length": len(post.content),
+                "categories": sorted([c.tag for c in post.categories.all()]),
+                "created_at": datetime_to_iso(post.created_at),
+                "updated_at": datetime_to_iso(post.updated_at),
+                "owner": user.id,
+            }
+            for post in posts
+        ]
+        assert [p["title"] for p in response.json()] == [a["title"] for a in attributes]
+
+    def test_bulk_create_with_invalid_item_error(self, django_user_model):
+        user = django_user_model.objects.create_user("test-user")
+        attributes = [
+            {"title": "title", "content": "content"},
+            {"content": "content", "categories": ["missing"]},
+        ]
+
+        self.client.force_login(user)
+        response = self.client.post("/posts/bulk/", data=attributes, format="json")
+
+        assert response.status_code == 400
+        assert response.json()[0] == {}
+        assert set(response.json()[1].keys()) == {"title", "categories"}
+        assert not Post.objects.exists()
+
+    def test_bulk_create_by_anonymous_error(self):
+        response = self.client.post("/posts/bulk/", data=[], format="json")
+
+        assert response.status_code == 403
+
+    def test_bulk_partial_update_by_owner(self, django_user_model):
+        owner = django_user_model.objects.create_user("test-owner")
+        not_owner = django_user_model.objects.create_user("test-not-owner")
+        categories = CategoryFactory.create_batch(2)
+        owned = PostFactory.create_batch(2, owner=owner, categories=categories)
+        alien = PostFactory(owner=not_owner)
+        attributes = [
+            {"id": owned[0].id, "title": "new-title"},
+            {"id": alien.id, "title": "stolen-title"},
+            {"id": owned[1].id, "categories": [categories[0].tag]},
+        ]
+
+        self.client.force_login(owner)
+        response = self.client.patch("/posts/bulk/", data=attributes, format="json")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["status"] for item in body] == [200, 404, 200]
+        assert body[0]["post"]["title"] == "new-title"
+        assert body[0]["post"]["content"] == owned[0].content
+        assert body[2]["post"]["title"] == owned[1].title
+        assert body[2]["post"]["categories"] == [categories[0].tag]
+        assert Post.objects.get(pk=owned[0].id).title == "new-title"
+        assert Post.objects.get(pk=alien.id).title == alien.title
+        assert Post.objects.get(pk=owned[0].id).updated_at > owned[0].updated_at
+
+    def test_bulk_partial_update_with_invalid_item_error(self, django_user_model):
+        owner = django_user_model.objects.create_user("test-owner")
+        posts = PostFactory.create_batch(2, owner=owner)
+        attributes = [
+            {"id": posts[0].id, "title": "new-title"},
+            {"id": posts[1].id, "title": "x" * 201},
+        ]
+
+        self.client.force_login(owner)
+        response = self.client.patch("/posts/bulk/", data=attributes, format="json")
+
+        assert response.status_code == 400
+        assert response.json()[0] == {}
+        assert set(response.json()[1].keys()) == {"title"}
+        assert Post.objects.get(pk=posts[0].id).title == posts[0].title
+
+    def test_bulk_destroy_by_owner(self, django_user_model):
+        owner = django_user_model.objects.create_user("test-owner")
+        not_owner = django_user_model.objects.create_user("test-not-owner")
+        owned = PostFactory(owner=owner, categories=CategoryFactory.create_batch(2))
+        alien = PostFactory(owner=not_owner)
+
+        self.client.force_login(owner)
+        response = self.client.delete(
+            "/posts/bulk/",
+            data={"ids": [owned.id, alien.id]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert [item["status"] for item in response.json()] == [204, 404]
+        assert not Post.objects.filter(pk=owned.id).exists()
+        assert Post.objects.filter(pk=alien.id).exists()
+
+    def test_bulk_destroy_with_duplicate_ids_error(self, django_user_model):
+        owner = django_user_model.objects.create_user("test-owner")
+        post = PostFactory(owner=owner)
+
+        self.client.force_login(owner)
+        response = self.client.delete(
+            "/posts/bulk/",
+            data={"ids": [post.id, post.id]},
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert Post.objects.filter(pk=post.id).exists()
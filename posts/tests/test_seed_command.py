@@ -0,0 +1,95 @@
+from collections import Counter
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from posts.models import Category, Post, Profile
+from posts.services import PostCountersService
+
+
+class TestSeedCommand:
+    @pytest.mark.django_db
+    def test_seed(self):
+        call_command(
+            "seed", users=20, posts=500, categories=10, profiles=0.5, batch_size=200
+        )
+
+        assert User.objects.count() == 20
+        assert 0 < Profile.objects.count() < 20
+        assert Category.objects.count() == 10
+        assert Post.objects.count() == 500
+        assert Post.categories.through.objects.exists()
+        assert User.objects.filter(username__startswith="user").count() == 20
+        assert User.objects.first().check_password("seed")
+
+    @pytest.mark.django_db
+    def test_seed_is_skewed(self):
+        call_command("seed", users=50, posts=2000, categories=20)
+
+        posts_per_owner = Counter(Post.objects.values_list("owner_id", flat=True))
+        [(_, most)] = posts_per_owner.most_common(1)
+        assert most > 10 * sorted(posts_per_owner.values())[len(posts_per_owner) // 2]
+        top_category = Category.objects.order_by("-post_count").first()
+        assert top_category.tag == "b0"
+
+    @pytest.mark.django_db
+    def test_seed_is_deterministic(self):
+        def seeded_posts():
+            call_command("seed", users=5, posts=50, categories=5, seed=7)
+            return [
+                (post.title, post.content, sorted(post.categories.values_list("tag")))
+                for post in Post.objects.order_by("id").prefetch_related("categories")
+            ]
+
+        first = seeded_posts()
+        User.objects.all().delete()
+
+        assert seeded_posts() == first
+
+    @pytest.mark.django_db
+    def test_seed_maintains_counters_and_search_vectors(self):
+        call_command("seed", users=10, posts=300, categories=10)
+
+        counters_service = PostCountersService()
+        assert counters_service.recount_categories("", 100)[1] == 0
+        assert counters_service.recount_users(0, 100)[1] == 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT count(*) FROM posts_post WHERE search_vector IS DISTINCT FROM
+                    setweight(to_tsvector('pg_catalog.english', title), 'A')
+                    || setweight(to_tsvector('pg_catalog.english', content), 'B')
+                """
+            )
+            assert cursor.fetchone() == (0,)
+
+    @pytest.mark.django_db
+    def test_seed_posts_for_existing_users(self):
+        call_command("seed", users=3, posts=0, categories=0)
+        call_command("seed", users=0, posts=30, categories=0)
+
+        assert User.objects.count() == 3
+        assert Post.objects.count() == 30
+        assert not Post.categories.through.objects.exists()
+
+    @pytest.mark.django_db
+    def test_seed_posts_without_users_error(self):
+        with pytest.raises(CommandError):
+            call_command("seed", users=0, posts=10)
+
+    def test_invalid_arguments_error(self):
+        for arguments in ({"posts": -1}, {"profiles": 2}, {"batch_size": 0}):
+            with pytest.raises(CommandError):
+                call_command("seed", **arguments)
+
+
+class TestSeedDataFixture:
+    def test_seed_data(self, seed_data):
+        user_ids, tags = seed_data(users=5, posts=40, categories=3)
+
+        assert sorted(User.objects.values_list("id", flat=True)) == user_ids
+        assert tags == ["b0", "b1", "b2"]
+        assert Post.objects.count() == 40
+        assert not Post.objects.filter(search_vector=None).exists()
@@ -6,6 +6,7 @@ from posts.tests.factories import (
     ProfileFactory,
 )
 from posts.tests.util import datetime_to_iso
+from posts.views import UserAPIView
 
 
 class TestUserView:
@@ -39,7 +40,8 @@ class TestUserView:
                 {
                     "id": post.id,
                     "title": post.title,
-                    "content": post.content,
+                    "excerpt": post.content,
+                    "content_length": len(post.content),
                     "owner": user.id,
                     "categories": [c.tag for c in post.categories.all()],
                     "created_at": datetime_to_iso(post.created_at),
@@ -47,8 +49,75 @@ class TestUserView:
                 }
                 for post in posts
             ],
+            "post_count": 2,
+            "posts_next": None,
         }
 
+    def test_get_by_authenticated_user_in_fixed_number_of_queries(
+        self,
+        django_user_model,
+        django_assert_num_queries,
+    ):
+        user = django_user_model.objects.create_user("user")
+        ProfileFactory(owner=user)
+        viewer = django_user_model.objects.create_user("test-viewer")
+        categories = CategoryFactory.create_batch(3)
+        PostFactory.create_batch(20, owner=user, categories=categories)
+
+        self.client.force_login(viewer)
+        # session, viewer, user with profile, posts, categories
+        with django_assert_num_queries(5):
+            response = self.client.get(f"/users/{user.id}/")
+
+        assert response.status_code == 200
+        assert len(response.json()["posts"]) == 20
+
+    def test_get_with_post_fields_by_authenticated_user(
+        self,
+        django_user_model,
+        django_assert_num_queries,
+    ):
+        user = django_user_model.objects.create_user("user")
+        viewer = django_user_model.objects.create_user("test-viewer")
+        posts = PostFactory.create_batch(
+            2, owner=user, categories=CategoryFactory.create_batch(2)
+        )
+
+        self.client.force_login(viewer)
+        # session, viewer, user with profile, posts without their categories
+        with django_assert_num_queries(4) as context:
+            response = self.client.get(
+                f"/users/{user.id}/?post_fields=id,title,content&post_exclude=content"
+            )
+
+        assert response.status_code == 200
+        assert response.json()["posts"] == [
+            {"id": post.id, "title": post.title} for post in posts
+        ]
+        assert '"content"' not in context.captured_queries[-1]["sql"]
+
+    def test_get_by_authenticated_user_with_more_posts_than_embedded(
+        self,
+        django_user_model,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(UserAPIView, "embedded_posts_limit", 2)
+        user = django_user_model.objects.create_user("user")
+        viewer = django_user_model.objects.create_user("test-viewer")
+        posts = PostFactory.create_batch(3, owner=user)
+        PostFactory()
+
+        self.client.force_login(viewer)
+        response = self.client.get(f"/users/{user.id}/")
+        next_response = self.client.get(response.json()["posts_next"])
+
+        assert response.status_code == 200
+        assert response.json()["profile"] is None
+        assert [p["id"] for p in response.json()["posts"]] == [p.id for p in posts[:2]]
+        assert next_response.status_code == 200
+        assert [p["id"] for p in next_response.json()["results"]] == [posts[2].id]
+        assert next_response.json()["next"] is None
+
     def test_get_anonymous(self):
         response = self.client.get("/users/123/")
 
@@ -0,0 +1,51 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from posts.models import Category, Post
+from posts.serializers import CategorySerializer, PostSerializer, ValuesSerializer
+from posts.tests.factories import CategoryFactory, PostFactory
+
+
+class TestValuesSerializer:
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("current_timezone", ("UTC", "Asia/Tokyo"))
+    def test_same_output_as_serializer(self, current_timezone):
+        categories = CategoryFactory.create_batch(3)
+        PostFactory(categories=categories[::-1])
+        PostFactory(categories=categories[1:2])
+        PostFactory()
+        posts = Post.objects.prefetch_related("categories")
+        values_serializer = ValuesSerializer(PostSerializer)
+
+        with timezone.override(current_timezone):
+            expected = PostSerializer(posts, many=True).data
+            actual = values_serializer.to_representation(
+                values_serializer.get_queryset(posts)
+            )
+
+        assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
+
+    @pytest.mark.django_db
+    def test_same_category_output_as_serializer(self):
+        CategoryFactory.create_batch(2)
+        values_serializer = ValuesSerializer(CategorySerializer)
+
+        actual = values_serializer.to_representation(
+            values_serializer.get_queryset(Category.objects.all())
+        )
+
+        assert actual == CategorySerializer(Category.objects.all(), many=True).data
+
+    def test_unsupported_field_error(self):
+        class TitleLengthSerializer(serializers.ModelSerializer):
+            title_length = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Post
+                fields = ("id", "title_length")
+
+        with pytest.raises(ImproperlyConfigured, match="title_length"):
+            ValuesSerializer(TitleLengthSerializer).get_queryset(Post.objects.all())
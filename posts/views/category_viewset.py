@@ -1,11 +1,61 @@
+from django.http import HttpResponse
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 from posts.models import Category
 from posts.permissions import IsAdminOrReadOnly
-from posts.serializers import CategorySerializer
+from posts.serializers import CategorySerializer, ValuesSerializer
+from posts.services import CategoriesCacheService
+from posts.views.mixins import ValuesReadMixin
 
 
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(ValuesReadMixin, ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    values_serializer = ValuesSerializer(CategorySerializer)
     permission_classes = (IsAdminOrReadOnly,)
+    cache_service = CategoriesCacheService()
+    # The browsable API renders per-user forms, so only plain JSON is shared.
+    cached_formats = ("json",)
+    # Queries per request, including the session and user.
+    query_budget = {
+        "list": 4,
+        "retrieve": 3,
+        "create": 4,
+        "update": 6,
+        "partial_update": 6,
+        "destroy": 5,
+    }
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        return self.__get_cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return self.__get_cached(super().retrieve, request, *args, **kwargs)
+
+    def __get_cached(self, handler, request: Request, *args, **kwargs):
+        if request.accepted_renderer.format not in self.cached_formats:
+            return handler(request, *args, **kwargs)
+
+        key = self.cache_service.get_response_key(
+            request.get_full_path(),
+            request.accepted_media_type,
+        )
+        cached = self.cache_service.get_response(key)
+        if cached is not None:
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = self.get_renderer_context()
+            response.render()
+            self.cache_service.set_response(
+                key,
+                response.content,
+                response["Content-Type"],
+            )
+        return response
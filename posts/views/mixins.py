@@ -0,0 +1,326 @@
+import hashlib
+from collections.abc import Iterable
+from functools import cache
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import HttpResponseBase
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import ManyRelatedField
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from posts.exceptions import PreconditionFailed
+
+
+class SparseFieldsMixin:
+    """
+    Reads narrowed to some fields of `sparse_fields_serializer_class` with
+    `?fields=` and `?exclude=`, both comma-separated; fields in
+    `get_sparse_excluded_fields()` are left out unless asked for. Only the
+    columns of those fields and of `sparse_required_fields` are loaded, and
+    many-to-many fields that are left out aren't queried at all. Writes
+    ignore them.
+    """
+
+    sparse_fields_serializer_class = None
+    sparse_required_fields = ()
+    sparse_excluded_fields = ()
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    unknown_fields_message = _("Unknown fields: {fields}.")
+
+    def get_sparse_fields(self) -> list[str] | None:
+        if (
+            self.sparse_fields_serializer_class is None
+            or self.request.method not in SAFE_METHODS
+        ):
+            return None
+        params = self.request.query_params
+        default_excluded = self.get_sparse_excluded_fields()
+        if not (
+            default_excluded
+            or self.fields_query_param in params
+            or self.exclude_query_param in params
+        ):
+            return None
+
+        available = get_field_sources(self.sparse_fields_serializer_class)
+        selected = self.__parse(self.fields_query_param, available) or [
+            name for name in available if name not in default_excluded
+        ]
+        excluded = self.__parse(self.exclude_query_param, available) or ()
+        return [name for name in available if name in selected and name not in excluded]
+
+    def get_sparse_excluded_fields(self) -> tuple[str, ...]:
+        return self.sparse_excluded_fields
+
+    def get_queryset(self):
+        return self.get_sparse_queryset(super().get_queryset())
+
+    def get_sparse_queryset(self, queryset):
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+
+        loaded = {*fields, *self.sparse_required_fields}
+        sources = get_field_sources(self.sparse_fields_serializer_class)
+        queryset = queryset.only(
+            *(
+                source
+                for name, (source, many) in sources.items()
+                if name in loaded and not many
+            )
+        )
+        if not any(sources[name][1] for name in loaded if name in sources):
+            queryset = queryset.prefetch_related(None)
+        return queryset
+
+    def __parse(self, param: str, available) -> list[str] | None:
+        value = self.request.query_params.get(param)
+        if value is None:
+            return None
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise DRFValidationError(
+                {param: [self.unknown_fields_message.format(fields=", ".join(unknown))]}
+            )
+        return names
+
+
+@cache
+def get_field_sources(serializer_class) -> dict[str, tuple[str, bool]]:
+    # Readable field names, with their source and whether it's many-to-many.
+    return {
+        name: (field.source, isinstance(field, ManyRelatedField))
+        for name, field in serializer_class().fields.items()
+        if not field.write_only
+    }
+
+
+class ValuesReadMixin(SparseFieldsMixin):
+    """
+    Lists and retrieves `.values()` rows serialized by `values_serializer`
+    when it is set, rather than model instances serialized by
+    `serializer_class`. Object permissions are then checked against the row.
+    """
+
+    values_serializer = None
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        queryset = self.get_read_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_read_data(page))
+        return Response(self.get_read_data(queryset))
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return Response(self.get_read_object_data(self.get_read_object()))
+
+    def uses_values(self) -> bool:
+        # The browsable API prefills its forms from `serializer.instance`.
+        return self.values_serializer is not None and not isinstance(
+            getattr(self.request, "accepted_renderer", None),
+            BrowsableAPIRenderer,
+        )
+
+    def get_values_serializer(self):
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return self.values_serializer
+        return self.values_serializer.select(fields, self.sparse_required_fields)
+
+    def get_read_queryset(self, queryset):
+        if not self.uses_values():
+            return queryset
+        return self.get_values_serializer().get_queryset(queryset)
+
+    def get_read_object(self):
+        if not self.uses_values():
+            return self.get_object()
+
+        queryset = self.get_read_queryset(self.filter_queryset(self.get_queryset()))
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            queryset,
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        self.check_object_permissions(self.request, row)
+        return row
+
+    def get_read_data(self, rows) -> list:
+        if not self.uses_values():
+            return self.get_serializer(rows, many=True).data
+        return self.get_values_serializer().to_representation(rows)
+
+    def get_read_object_data(self, obj) -> dict:
+        if not self.uses_values():
+            return self.get_serializer(obj).data
+        return self.get_values_serializer().to_representation([obj])[0]
+
+
+class ConditionalRequestMixin(ValuesReadMixin):
+    """
+    ETag and Last-Modified validators derived from `updated_at`, so polling
+    clients get `304 Not Modified` before anything is serialized, and writes
+    can be made conditional with `If-Match`.
+
+    The ETag is the validator to use. Last-Modified only has whole seconds,
+    so it misses a second write within the same second; it is only sent for
+    single objects, as a page's newest `updated_at` also misses deletions.
+
+    Conditional reads only load the columns in `validator_fields`; everything
+    else is fetched once the resource turns out to have changed.
+    """
+
+    validator_fields = ("id", "created_at", "updated_at")
+    conditional_read_headers = ("HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+    conditional_list_headers = ("HTTP_IF_NONE_MATCH",)
+    conditional_write_headers = ("HTTP_IF_MATCH", "HTTP_IF_UNMODIFIED_SINCE")
+
+    def list(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if self.__has_headers(request, self.conditional_list_headers):
+            validators = queryset.prefetch_related(None).values(*self.validator_fields)
+            page = self.__paginate(validators)
+            not_modified = self.__get_not_modified(request, page, many=True)
+            if not_modified is not None:
+                return not_modified
+            ids = [row["id"] for row in page]
+            rows = self.get_read_queryset(queryset.filter(pk__in=ids))
+            rows = {self.__get_value(row, "id"): row for row in rows}
+            page = [rows[pk] for pk in ids if pk in rows]
+        else:
+            page = self.__paginate(self.get_read_queryset(queryset))
+
+        data = self.get_read_data(page)
+        if self.paginator is not None:
+            response = self.get_paginated_response(data)
+        else:
+            response = Response(data)
+        return self.__set_validators(response, page, many=True)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        if self.__has_headers(request, self.conditional_read_headers):
+            # Reads are public, so skipping object permissions for a 304 is safe.
+            validators = self.__get_object_validators()
+            if validators is not None:
+                not_modified = self.__get_not_modified(request, [validators])
+                if not_modified is not None:
+                    return not_modified
+
+        instance = self.get_read_object()
+        response = Response(self.get_read_object_data(instance))
+        return self.__set_validators(response, [instance])
+
+    def perform_update(self, serializer):
+        instance = serializer.instance
+        if not self.__has_headers(self.request, self.conditional_write_headers):
+            super().perform_update(serializer)
+        else:
+            failed = get_conditional_response(
+                self.request,
+                etag=self.__get_etag([instance]),
+                last_modified=self.__get_last_modified([instance]),
+            )
+            if failed is not None:
+                raise PreconditionFailed()
+
+            with transaction.atomic():
+                # Claim the version we validated against: a concurrent writer
+                # either already moved `updated_at` on, or waits for our commit
+                # and then finds nothing to claim.
+                claimed = (
+                    type(instance)
+                    ._default_manager.filter(
+                        pk=instance.pk,
+                        updated_at=instance.updated_at,
+                    )
+                    .update(updated_at=timezone.now())
+                )
+                if not claimed:
+                    raise PreconditionFailed()
+                super().perform_update(serializer)
+
+        self.headers.update(self.__get_validator_headers([serializer.instance]))
+
+    def __paginate(self, queryset) -> list:
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return list(queryset)
+        return page
+
+    def __get_object_validators(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        try:
+            return queryset.values(*self.validator_fields).get(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            return None
+
+    def __get_not_modified(self, request: Request, objects, many: bool = False):
+        response = get_conditional_response(
+            request,
+            etag=self.__get_etag(objects, weak=many),
+            last_modified=None if many else self.__get_last_modified(objects),
+        )
+        if response is not None and response.status_code == 304:
+            for header, value in self.__get_validator_headers(objects, many).items():
+                response[header] = value
+        return response
+
+    def __set_validators(self, response, objects, many: bool = False):
+        for header, value in self.__get_validator_headers(objects, many).items():
+            response[header] = value
+        return response
+
+    def __get_validator_headers(self, objects, many: bool = False) -> dict[str, str]:
+        headers = {"ETag": self.__get_etag(objects, weak=many)}
+        last_modified = None if many else self.__get_last_modified(objects)
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(last_modified)
+        return headers
+
+    def __get_etag(self, objects: Iterable, weak: bool = False) -> str:
+        digest = hashlib.md5(str(self.request.accepted_media_type).encode())
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            # Other fields of the same rows are another representation.
+            digest.update(",".join(fields).encode())
+        for obj in objects:
+            pk, updated_at = self.__get_value(obj, "id"), self.__get_value(
+                obj, "updated_at"
+            )
+            digest.update(f"{pk}:{updated_at.isoformat()};".encode())
+        if weak and self.paginator is not None:
+            # Counts and links are part of a page, but not of its rows.
+            meta = self.paginator.get_paginated_response([]).data
+            digest.update(repr(sorted(meta.items())).encode())
+        etag = quote_etag(digest.hexdigest())
+        return f"W/{etag}" if weak else etag
+
+    def __get_last_modified(self, objects: Iterable) -> int | None:
+        updated_at = [self.__get_value(obj, "updated_at") for obj in objects]
+        if not updated_at:
+            return None
+        return int(max(updated_at).timestamp())
+
+    @staticmethod
+    def __get_value(obj, name: str):
+        # Model instances, or `.values()` rows on the fast read path.
+        return obj[name] if isinstance(obj, dict) else getattr(obj, name)
+
+    @staticmethod
+    def __has_headers(request: Request, headers: Iterable[str]) -> bool:
+        return any(header in request.META for header in headers)
@@ -1,15 +1,211 @@
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_201_CREATED
 
+from blog_drf.pagination import CursorOrPageNumberPagination
+from blog_drf.renderers import FastJSONRenderer
+from posts.filters import PostFilterBackend
 from posts.models.post import Post
 from posts.permissions import IsOwnerOrReadOnly
-from posts.serializers import PostSerializer
+from posts.serializers import (
+    BULK_MAX_ITEMS,
+    PostBulkDeleteSerializer,
+    PostBulkUpdateItemSerializer,
+    PostSerializer,
+    ValuesSerializer,
+)
+from posts.services import PostsBulkService
+from posts.views.mixins import ConditionalRequestMixin, get_field_sources
 
 
-class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all()
+class PostViewSet(ConditionalRequestMixin, viewsets.ModelViewSet):
+    queryset = Post.objects.prefetch_related("categories")
     serializer_class = PostSerializer
     permission_classes = (IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly)
+    pagination_class = CursorOrPageNumberPagination
+    filter_backends = (PostFilterBackend,)
+    bulk_service = PostsBulkService()
+    values_serializer = ValuesSerializer(PostSerializer)
+    sparse_fields_serializer_class = PostSerializer
+    # Keys of the orderings and of the ETag, loaded whatever the fields.
+    sparse_required_fields = ("id", "created_at", "updated_at")
+    # Lists have the excerpt, so they never read the content unless asked to.
+    list_excluded_fields = ("content",)
+    # Maintained by the database as the post is written.
+    derived_fields = ("excerpt", "content_length")
+    # Writes re-read the categories for their response, if they have one.
+    unprefetched_actions = ("update", "partial_update", "destroy")
+    not_found_message = _("Not found.")
+    duplicate_ids_message = _("Each post may only appear once.")
+    export_chunk_size = 2000
+    # Kept on every exported line, whatever the fields, to resume from.
+    export_required_fields = ("id", "updated_at")
+    export_renderer_class = FastJSONRenderer
+    # Queries per request, including the session and user.
+    query_budget = {
+        "list": 4,
+        "retrieve": 3,
+        "create": 7,
+        "update": 9,
+        "partial_update": 9,
+        "destroy": 5,
+        "export": 3,
+        "bulk_create": 9,
+        "bulk_partial_update": 12,
+        "bulk_destroy": 8,
+    }
+
+    def get_serializer_context(self):
+        return super().get_serializer_context() | {
+            "post_fields": self.get_sparse_fields()
+        }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.unprefetched_actions:
+            return queryset.prefetch_related(None)
+        return queryset
+
+    def get_sparse_excluded_fields(self) -> tuple[str, ...]:
+        return self.list_excluded_fields if self.action == "list" else ()
+
+    def get_sparse_fields(self) -> list[str] | None:
+        fields = super().get_sparse_fields()
+        if fields is None or self.action != "export":
+            return fields
+        return [
+            name
+            for name in get_field_sources(self.sparse_fields_serializer_class)
+            if name in fields or name in self.export_required_fields
+        ]
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
+        serializer.instance.refresh_from_db(fields=self.derived_fields)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        serializer.instance.refresh_from_db(fields=self.derived_fields)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """
+        Every post matching the list filters as newline-delimited JSON,
+        oldest update first, so the last line's `updated_at` is the
+        `updated_since` watermark for the next incremental export. Lines
+        always have the `id` and `updated_at`, whatever the `fields`.
+
+        `updated_since` includes posts updated at that very time, so the
+        next export repeats the last posts of this one; skip those by `id`.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by(
+            "updated_at", "id"
+        )
+        return StreamingHttpResponse(
+            self.__stream(queryset),
+            content_type="application/x-ndjson",
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            max_length=BULK_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+        posts = self.bulk_service.create(request.user, serializer.validated_data)
+        posts = self.__reload([post.id for post in posts])
+        serializer = self.get_serializer(posts, many=True)
+        return Response(serializer.data, status=HTTP_201_CREATED)
+
+    @bulk_create.mapping.patch
+    def bulk_partial_update(self, request: Request) -> Response:
+        items_serializer = PostBulkUpdateItemSerializer(
+            data=request.data,
+            many=True,
+            max_length=BULK_MAX_ITEMS,
+        )
+        items_serializer.is_valid(raise_exception=True)
+        ids = [item["id"] for item in items_serializer.validated_data]
+        self.__validate_unique(ids)
+
+        owned = (
+            self.get_queryset()
+            .prefetch_related(None)
+            .filter(owner=request.user, pk__in=ids)
+            .in_bulk()
+        )
+        owned_ids = [post_id for post_id in ids if post_id in owned]
+        serializer = self.get_serializer(
+            data=[item for post_id, item in zip(ids, request.data) if post_id in owned],
+            many=True,
+            partial=True,
+        )
+        if not serializer.is_valid():
+            errors = dict(zip(owned_ids, serializer.errors))
+            raise ValidationError([errors.get(post_id, {}) for post_id in ids])
+
+        self.bulk_service.update(
+            [owned[post_id] for post_id in owned_ids],
+            serializer.validated_data,
+        )
+        updated = self.__reload(owned_ids)
+        data = {
+            post["id"]: post for post in self.get_serializer(updated, many=True).data
+        }
+        return Response(
+            [
+                {"id": post_id, "status": 200, "post": data[post_id]}
+                if post_id in data
+                else self.__get_not_found(post_id)
+                for post_id in ids
+            ]
+        )
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request: Request) -> Response:
+        serializer = PostBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        self.__validate_unique(ids)
+
+        deleted = self.bulk_service.delete(request.user, ids)
+        return Response(
+            [
+                {"id": post_id, "status": 204}
+                if post_id in deleted
+                else self.__get_not_found(post_id)
+                for post_id in ids
+            ]
+        )
+
+    def __stream(self, queryset):
+        # A server-side cursor reads one snapshot of the table chunk by chunk,
+        # so memory doesn't grow with it.
+        renderer = self.export_renderer_class()
+        rows = self.get_read_queryset(queryset).iterator(
+            chunk_size=self.export_chunk_size
+        )
+        while chunk := list(islice(rows, self.export_chunk_size)):
+            yield b"".join(
+                renderer.render(item) + b"\n" for item in self.get_read_data(chunk)
+            )
+
+    def __reload(self, ids: list[int]):
+        return self.get_queryset().filter(pk__in=ids)
+
+    def __validate_unique(self, ids: list[int]) -> None:
+        if len(set(ids)) != len(ids):
+            raise ValidationError([self.duplicate_ids_message])
+
+    def __get_not_found(self, post_id: int) -> dict:
+        return {"id": post_id, "status": 404, "detail": self.not_found_message}
@@ -7,8 +7,11 @@ from rest_framework.status import HTTP_201_CREATED, HTTP_204_NO_CONTENT
 from rest_framework.views import APIView
 
 from posts.permissions import DoesUserAffectHisObject, IsOwnerOrReadOnly
-from posts.serializers import DetailedProfileSerializer
-from posts.services import UsersService
+from posts.serializers import (
+    DetailedProfileSerializer,
+    DetailedProfileWriteSerializer,
+)
+from posts.services import ProfilesService
 
 
 class ProfileAPIView(APIView):
@@ -17,46 +20,44 @@ class ProfileAPIView(APIView):
         IsOwnerOrReadOnly,
         DoesUserAffectHisObject,
     )
-    users_service = UsersService()
+    profiles_service = ProfilesService()
+    query_budget = 3
 
+    # Writes are keyed by the requesting user, whom DoesUserAffectHisObject
+    # has already matched against the URL, so they can't reach another
+    # user's profile.
     def post(self, request: Request, *args, **kwargs) -> Response:
-        data = request.data | {"owner": kwargs["user_id"]}
-        serializer = DetailedProfileSerializer(data=data)
+        serializer = DetailedProfileWriteSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save(owner=request.user)
-        headers = self.__get_success_headers(serializer.data)
-        return Response(serializer.data, status=HTTP_201_CREATED, headers=headers)
+        profile, created = self.profiles_service.upsert(
+            request.user,
+            serializer.validated_data,
+        )
+        data = DetailedProfileSerializer(profile).data
+        if not created:
+            return Response(data)
+        headers = self.__get_success_headers(data)
+        return Response(data, status=HTTP_201_CREATED, headers=headers)
 
     def put(self, request: Request, *args, **kwargs) -> Response:
-        data = request.data | {"owner": kwargs["user_id"]}
-        if not self.users_service.has_profile(user=request.user):
-            raise Http404()
-        profile = request.user.profile
-        self.check_object_permissions(request, profile)
-        serializer = DetailedProfileSerializer(profile, data=data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save(owner=request.user)
-        return Response(serializer.data)
+        return self.__update(request, partial=False)
 
     def patch(self, request: Request, *args, **kwargs) -> Response:
-        data = request.data | {"owner": kwargs["user_id"]}
-        if not self.users_service.has_profile(user=request.user):
-            raise Http404()
-        profile = request.user.profile
-        self.check_object_permissions(request, profile)
-        serializer = DetailedProfileSerializer(profile, data=data, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save(owner=request.user)
-        return Response(serializer.data)
+        return self.__update(request, partial=True)
 
     def delete(self, request: Request, *args, **kwargs) -> Response:
-        if not self.users_service.has_profile(user=request.user):
+        if not self.profiles_service.delete(request.user):
             raise Http404()
-        profile = request.user.profile
-        self.check_object_permissions(request, profile)
-        profile.delete()
         return Response(status=HTTP_204_NO_CONTENT)
 
+    def __update(self, request: Request, partial: bool) -> Response:
+        serializer = DetailedProfileWriteSerializer(data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        profile = self.profiles_service.update(request.user, serializer.validated_data)
+        if profile is None:
+            raise Http404()
+        return Response(DetailedProfileSerializer(profile).data)
+
     def __get_success_headers(self, data: dict) -> dict[str, str]:
         try:
             return {"Location": str(data[api_settings.URL_FIELD_NAME])}
@@ -1,17 +1,53 @@
 from django.contrib.auth.models import User
+from django.db.models import Prefetch, QuerySet
+from django.urls import reverse
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from posts.serializers import UserSerializer
+from blog_drf.pagination import SignedCursorPagination
+from posts.models import Post
+from posts.serializers import PostSerializer, UserSerializer
+from posts.views.mixins import SparseFieldsMixin
 
 
-class UserAPIView(APIView):
+class UserAPIView(SparseFieldsMixin, APIView):
     permission_classes = (IsAuthenticated,)
+    embedded_posts_limit = 30
+    query_budget = 5
+    # `?post_fields=` and `?post_exclude=` narrow the embedded posts, which
+    # have their excerpt rather than their content by default.
+    sparse_fields_serializer_class = PostSerializer
+    sparse_required_fields = ("id", "owner")
+    sparse_excluded_fields = ("content",)
+    fields_query_param = "post_fields"
+    exclude_query_param = "post_exclude"
 
     def get(self, request: Request, user_id: int, *args, **kwargs) -> Response:
-        user = get_object_or_404(User, pk=user_id)
-        serializer = UserSerializer(user)
-        return Response(serializer.data)
+        user = get_object_or_404(self.get_queryset(), pk=user_id)
+        posts = user.embedded_posts
+        user.embedded_posts = posts[: self.embedded_posts_limit]
+        serializer = UserSerializer(
+            user, context={"post_fields": self.get_sparse_fields()}
+        )
+        posts_next = None
+        if len(posts) > self.embedded_posts_limit:
+            posts_next = self.__get_posts_next_link(request, user)
+        return Response(serializer.data | {"posts_next": posts_next})
+
+    def get_queryset(self) -> QuerySet:
+        # One extra post tells us whether there is anything to link to.
+        posts = self.get_sparse_queryset(Post.objects.prefetch_related("categories"))
+        posts = posts[: self.embedded_posts_limit + 1]
+        return User.objects.select_related("profile", "stats").prefetch_related(
+            Prefetch("posts", queryset=posts, to_attr="embedded_posts"),
+        )
+
+    def __get_posts_next_link(self, request: Request, user: User) -> str:
+        base_url = request.build_absolute_uri(f"{reverse('post-list')}?owner={user.id}")
+        return SignedCursorPagination().get_link_after(
+            base_url,
+            user.embedded_posts[-1],
+        )